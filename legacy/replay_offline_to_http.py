@@ -2,9 +2,21 @@ import os
 import json
 import argparse
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # orjson es opcional: si no está, json de la stdlib
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 def find_batch_files(base_dir: str) -> List[str]:
@@ -15,27 +27,79 @@ def find_batch_files(base_dir: str) -> List[str]:
       base_dir/raid001/batch_0002.json
       base_dir/raid002/batch_0001.json
     """
+    # os.scandir con pila explícita: el tipo de cada entrada viene del propio
+    # readdir (DirEntry), sin el stat extra por fichero de os.walk
     batch_files = []
-    for root, _, files in os.walk(base_dir):
-        for name in files:
-            if name.startswith("batch_") and name.endswith(".json"):
-                batch_files.append(os.path.join(root, name))
+    stack = [base_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (
+                    entry.name.startswith("batch_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    batch_files.append(entry.path)
     batch_files.sort()
     return batch_files
 
 
-def send_batch_file(path: str, receiver_url: str, timeout: float = 10.0):
+def make_session(pool_size: int, retries: int = 3) -> requests.Session:
+    """
+    Session HTTP con pool de conexiones keep-alive de tamaño pool_size,
+    compartida por todos los workers (una conexión TCP por worker, reutilizada).
+
+    Reintenta con backoff exponencial (factor 0.5s) solo los fallos en los
+    que el receptor seguro que no ha procesado el batch: errores al conectar
+    y 503 (storage_busy, el batch no se encoló). No se reintentan errores o
+    timeouts de lectura ni 502/504: el receptor puede haber guardado ya el
+    batch y, como cada POST recibe un batch_id nuevo, el reintento duplicaría
+    los eventos en Bronze.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        other=0,
+        status=retries,
+        backoff_factor=0.5,
+        status_forcelist=(503,),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def send_batch_file(
+    path: str,
+    receiver_url: str,
+    timeout: float = 10.0,
+    session: Optional[requests.Session] = None,
+):
     """
     Lee un batch offline y lo envía a /events.
+    Si se pasa session, reutiliza sus conexiones en lugar de abrir una nueva.
+
+    El fichero ya es JSON válido: se envían sus bytes tal cual como body, sin
+    parsearlo y volver a serializarlo.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        payload = json.load(f)
+    with open(path, "rb") as f:
+        body = f.read()
 
-    resp = requests.post(receiver_url, json=payload, timeout=timeout)
+    http = session if session is not None else requests
+    resp = http.post(receiver_url, data=body, headers=JSON_HEADERS, timeout=timeout)
     data = None
     try:
-        data = resp.json()
-    except Exception:
+        data = _json_loads(resp.content) if resp.content else None
+    except ValueError:
         pass
     return resp.status_code, data
 
@@ -60,6 +124,18 @@ def main():
         default=0,
         help="Máximo número de ficheros a reenviar (0 = todos)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Batches en vuelo simultáneamente (1 = envío secuencial)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Reintentos con backoff ante errores de conexión o 503 (storage_busy)",
+    )
     args = parser.parse_args()
 
     print(">>> replay_offline_to_http: inicio")
@@ -73,13 +149,25 @@ def main():
     t0 = time.time()
     total_events = 0
 
-    for i, path in enumerate(batch_files, start=1):
-        status, data = send_batch_file(path, args.receiver_url)
+    concurrency = max(1, args.concurrency)
+    session = make_session(concurrency, retries=args.retries)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    # map() conserva el orden de batch_files: los logs salen en orden aunque
+    # los envíos (lectura de disco, red, receptor) se solapen entre workers
+    results = pool.map(
+        lambda p: send_batch_file(p, args.receiver_url, session=session),
+        batch_files,
+    )
 
+    for i, (path, (status, data)) in enumerate(zip(batch_files, results), start=1):
         # Log mínimo por batch
         if not (200 <= status < 300):
             print(f"[ERROR] HTTP {status} para batch {path}")
             print(data)
+            # No lanzar más envíos; los ya en vuelo terminan
+            pool.shutdown(wait=True, cancel_futures=True)
+            session.close()
             return
 
         eventcount = data.get("eventcount") if isinstance(data, dict) else None
@@ -88,6 +176,9 @@ def main():
         print(f"[OK] {i}/{len(batch_files)} status={status} "
               f"batch_id={data.get('batchid')} eventcount={eventcount} path={path}") # type: ignore
 
+    pool.shutdown()
+    session.close()
+
     elapsed = time.time() - t0
     print(f"Total eventos reenviados: {total_events}")
     print(f"Tiempo total: {elapsed:.2f}s -> {total_events/elapsed:.1f} ev/s")
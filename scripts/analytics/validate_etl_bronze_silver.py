@@ -8,7 +8,7 @@ import json
 import pandas as pd
 from datetime import datetime
 
-from src.storage.minio_client import MinIOStorageClient
+from src.storage.minio_client import MinIOStorageClient, decode_bronze_body
 
 
 def format_bytes(size_bytes):
@@ -63,7 +63,7 @@ def inspect_bronze_file(bronze_key):
 
     # Leer contenido
     obj = storage.get_object(bronze_bucket, bronze_key)
-    content = obj.read().decode("utf-8")
+    content = decode_bronze_body(obj.read()).decode("utf-8")
     data = json.loads(content)
 
     print("\n📊 Estructura del Batch:")
@@ -8,19 +8,56 @@ Endpoint: POST /events
 
 from flask import Flask, request, jsonify, Response, stream_with_context
 from pydantic import ValidationError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import threading
 import uuid
 import json
 import time
 
-from src.schemas.eventos_schema import WoWRaidEvent
-from src.storage.minio_client import MinIOStorageClient
+from src.config import Config
+from src.schemas.eventos_schema import BATCH_ADAPTER
+from src.storage.minio_client import (
+    BATCH_MAX_ATTEMPTS,
+    REQUEST_MAX_ATTEMPTS,
+    MinIOStorageClient,
+)
 from src.api.sse_bus import sse_bus
 
 app = Flask(__name__)
 
-# Inicializar cliente de almacenamiento (singleton para toda la app)
-storage_client = MinIOStorageClient()
+# Inicializar cliente de almacenamiento (singleton para toda la app).
+# En modo síncrono la subida bloquea la respuesta de POST /events: pocos
+# reintentos para fallar rápido. En segundo plano nadie espera la respuesta
+# y se usa el presupuesto largo de batch
+storage_client = MinIOStorageClient(
+    max_attempts=BATCH_MAX_ATTEMPTS if Config.ASYNC_UPLOADS else REQUEST_MAX_ATTEMPTS
+)
+
+# Subidas a Bronze en segundo plano (Config.ASYNC_UPLOADS): /events responde
+# tras validar y encolar, sin esperar el round-trip a MinIO. El semáforo
+# acota los batches pendientes (y la memoria que retienen). Sin
+# ASYNC_UPLOADS no se crea el pool
+upload_pool: ThreadPoolExecutor | None = (
+    ThreadPoolExecutor(
+        max_workers=Config.UPLOAD_WORKERS, thread_name_prefix="bronze-upload"
+    )
+    if Config.ASYNC_UPLOADS
+    else None
+)
+pending_uploads = threading.BoundedSemaphore(Config.MAX_PENDING_UPLOADS)
+
+
+def _save_batch_in_background(raid_id: str, batch_data: dict) -> None:
+    """Persiste un batch encolado; los fallos se registran en el log."""
+    try:
+        storage_client.save_batch(raid_id, batch_data)
+    except Exception:
+        app.logger.exception(
+            "Error guardando en Bronze el batch %s", batch_data["batch_id"]
+        )
+    finally:
+        pending_uploads.release()
 
 
 @app.route("/health", methods=["GET"])
@@ -55,34 +92,69 @@ def receive_events():
     if len(payload) == 0:
         return jsonify({"error": "Empty payload"}), 400
 
-    # Validate each event with Pydantic
+    # Validate the whole batch in one pydantic-core call
     validated_events = []
     errors = []
 
-    for idx, event_data in enumerate(payload):
-        try:
-            event = WoWRaidEvent(**event_data)
-            validated_events.append(event)
-        except ValidationError as e:
-            errors.append(
-                {"index": idx, "event_data": event_data, "errors": e.errors()}
-            )
+    # Un único "now" por lote: sirve de ingestion_timestamp de cada evento
+    # (evita el default_factory por evento) y de referencia para el
+    # validador de timestamp futuro
+    now = datetime.now(timezone.utc)
+    # Copias superficiales: el payload del cliente no se modifica, así los
+    # errores 400 devuelven en event_data exactamente lo que se envió
+    events_in = [
+        {
+            **event_data,
+            "ingestion_timestamp": event_data.get("ingestion_timestamp", now),
+        }
+        if isinstance(event_data, dict)
+        else event_data
+        for event_data in payload
+    ]
+
+    try:
+        validated_events = BATCH_ADAPTER.validate_python(
+            events_in, context={"now": now}
+        )
+    except ValidationError as e:
+        # Agrupar los errores por índice de evento (loc[0]) para conservar
+        # el formato de respuesta por evento
+        by_index: dict[int, list] = {}
+        for err in e.errors():
+            pos, *loc = err["loc"]
+            by_index.setdefault(int(pos), []).append({**err, "loc": tuple(loc)})
+        errors = [
+            {"index": idx, "event_data": payload[idx], "errors": errs}
+            for idx, errs in sorted(by_index.items())
+        ]
 
     # If any validation failed, reject entire batch
     if errors:
         return jsonify(
             {
                 "status": "validation_failed",
-                "valid_count": len(validated_events),
+                "valid_count": len(payload) - len(errors),
                 "invalid_count": len(errors),
                 "errors": errors[:5],  # Return first 5 errors
             }
         ), 400
 
-    # Publicar eventos validados en el bus SSE
-    for ev in validated_events:
-        ev_dict = ev.model_dump(mode="json")
-        sse_bus.publish(ev_dict)
+    # Cola de subidas llena: rechazar antes de volcar y publicar el lote, así
+    # un batch rechazado (y reintentado por el cliente) no llega dos veces a
+    # los suscriptores SSE
+    if upload_pool is not None and not pending_uploads.acquire(blocking=False):
+        return jsonify(
+            {
+                "status": "storage_busy",
+                "error": "Too many pending Bronze uploads, retry later",
+                "events_validated": len(validated_events),
+            }
+        ), 503
+
+    # Volcado JSON-safe de todo el lote en una sola llamada a pydantic-core:
+    # datetime/UUID/enums ya salen como str, así que ni el bus SSE ni la
+    # serialización de Bronze necesitan el callback default=str
+    events_json = BATCH_ADAPTER.dump_python(validated_events, mode="json")
 
     # --- NUEVA LÓGICA: Persistencia en Bronze ---
 
@@ -91,15 +163,48 @@ def receive_events():
 
     # Crear el batch envelope
     batch_id = str(uuid.uuid4())
-    ingest_timestamp = datetime.now(timezone.utc).isoformat()
+    ingest_timestamp = now.isoformat()
 
     batch_data = {
         "batch_id": batch_id,
         "ingest_timestamp": ingest_timestamp,
         "event_count": len(validated_events),
-        "events": [event.model_dump(mode="json") for event in validated_events],
+        "events": events_json,
     }
 
+    if upload_pool is not None:
+        try:
+            upload_pool.submit(_save_batch_in_background, raid_id, batch_data)
+        except Exception as e:
+            # p. ej. RuntimeError con el pool ya cerrado: devolver el hueco
+            # del semáforo, o la cola acabaría respondiendo 503 para siempre
+            pending_uploads.release()
+            return jsonify(
+                {
+                    "status": "storage_error",
+                    "error": str(e),
+                    "events_validated": len(validated_events),
+                }
+            ), 500
+
+        # Publicar eventos validados en el bus SSE (batch ya encolado)
+        for ev_dict in events_json:
+            sse_bus.publish(ev_dict)
+
+        return jsonify(
+            {
+                "status": "accepted",
+                "batch_id": batch_id,
+                "events_received": len(validated_events),
+                "storage": {"status": "queued"},
+                "timestamp": ingest_timestamp,
+            }
+        ), 202  # 202 Accepted: persistencia pendiente
+
+    # Publicar eventos validados en el bus SSE
+    for ev_dict in events_json:
+        sse_bus.publish(ev_dict)
+
     # Guardar en MinIO Bronze
     try:
         storage_result = storage_client.save_batch(raid_id, batch_data)
@@ -6,7 +6,7 @@ Lee TODOS los archivos JSON de Bronze, transforma a Parquet y escribe en Silver.
 from tqdm import tqdm
 
 from src.etl.bronze_to_silver import BronzeToSilverETL
-from src.storage.minio_client import MinIOStorageClient
+from src.storage.minio_client import BRONZE_EXTENSIONS, MinIOStorageClient
 
 
 def list_bronze_files(storage: MinIOStorageClient, bucket: str = "bronze") -> list:
@@ -33,8 +33,8 @@ def list_bronze_files(storage: MinIOStorageClient, bucket: str = "bronze") -> li
         for obj in response["Contents"]:
             key = obj["Key"]  # ← Acceso por diccionario, no atributo
 
-            # Filtrar solo archivos JSON
-            if key.endswith(".json"):
+            # Filtrar solo batches (JSON o Parquet)
+            if key.endswith(BRONZE_EXTENSIONS):
                 json_files.append(key)
 
         # Manejar paginación (si hay más de 1000 objetos)
@@ -47,7 +47,7 @@ def list_bronze_files(storage: MinIOStorageClient, bucket: str = "bronze") -> li
             if "Contents" in response:
                 for obj in response["Contents"]:
                     key = obj["Key"]
-                    if key.endswith(".json"):
+                    if key.endswith(BRONZE_EXTENSIONS):
                         json_files.append(key)
 
         print(f"  ✅ Encontrados: {len(json_files)} archivos JSON")
@@ -1,8 +1,199 @@
+from dataclasses import dataclass
+
 import pandas as pd
 import numpy as np
 
 
-def build_raid_summary(df_silver: pd.DataFrame) -> pd.DataFrame:
+def _value_masks(values: pd.Series, names: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """
+    Máscaras booleanas values == name para cada name (nulos -> False).
+
+    La columna se codifica una sola vez (códigos de la categórica o
+    factorize) y cada máscara es una comparación de enteros sobre esos códigos.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+    uniques = pd.Index(uniques)
+    return {
+        name: codes == uniques.get_loc(name)
+        if name in uniques
+        else np.zeros(len(codes), dtype=bool)
+        for name in names
+    }
+
+
+def _float_values(values: pd.Series) -> np.ndarray:
+    """Columna numérica como float64 NumPy (nulos -> NaN)."""
+    return np.asarray(values.to_numpy(dtype="float64", na_value=np.nan), np.float64)
+
+
+def _group_sum(
+    codes: np.ndarray, n_groups: int, values: np.ndarray, mask: np.ndarray
+) -> np.ndarray:
+    """Suma por grupo de values[mask], ignorando NaN (como groupby.sum)."""
+    sel = mask & (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[sel], weights=values[sel], minlength=n_groups)
+    return sums.astype("float64", copy=False)  # sin filas, bincount da int64
+
+
+def _group_count(codes: np.ndarray, n_groups: int, mask: np.ndarray) -> np.ndarray:
+    """Nº de filas por grupo que cumplen mask."""
+    return np.bincount(codes[mask & (codes >= 0)], minlength=n_groups)
+
+
+def _safe_divide(
+    numerator: np.ndarray, denominator: np.ndarray, where: np.ndarray
+) -> np.ndarray:
+    """numerator / denominator donde `where`, 0.0 en el resto (sin warnings)."""
+    out = np.zeros(len(numerator), dtype="float64")
+    np.divide(numerator, denominator, out=out, where=where)
+    return out
+
+
+def _raid_outcome(
+    boss_min_hp_pct: np.ndarray,
+    duration_ms: np.ndarray,
+    total_player_deaths: np.ndarray,
+    n_players: np.ndarray,
+) -> np.ndarray:
+    """Regla de raid_outcome (ver apply_raid_outcome_rule) sobre arrays."""
+    T_MAX = 360000  # 6 minutos
+
+    cond_success_kill = (boss_min_hp_pct == 0.0) & (duration_ms <= T_MAX)
+    cond_success_almost = (boss_min_hp_pct < 10.0) & (total_player_deaths <= n_players)
+    return np.where(cond_success_kill | cond_success_almost, "success", "wipe")
+
+
+def _group_bit_or(codes: np.ndarray, n_groups: int, bits: np.ndarray) -> np.ndarray:
+    """OR bit a bit de bits por grupo (filas con código -1 se ignoran)."""
+    out = np.zeros(n_groups, dtype=bits.dtype)
+    valid = codes >= 0
+    np.bitwise_or.at(out, codes[valid], bits[valid])
+    return out
+
+
+def _group_reduce(
+    ufunc: np.ufunc,
+    codes: np.ndarray,
+    n_groups: int,
+    values: np.ndarray,
+    mask: np.ndarray,
+) -> np.ndarray:
+    """
+    Mínimo/máximo por grupo (ufunc = np.minimum / np.maximum) de values[mask].
+
+    Los grupos sin filas quedan con el elemento neutro de la reducción
+    (+inf / -inf, o los extremos del entero).
+    """
+    if np.issubdtype(values.dtype, np.floating):
+        neutral = np.inf if ufunc is np.minimum else -np.inf
+    else:
+        info = np.iinfo(values.dtype)
+        neutral = info.max if ufunc is np.minimum else info.min
+    out = np.full(n_groups, neutral, dtype=values.dtype)
+    sel = mask & (codes >= 0)
+    ufunc.at(out, codes[sel], values[sel])
+    return out
+
+
+def _group_first(codes: np.ndarray, n_groups: int, values: pd.Series):
+    """Primer valor no nulo de cada grupo (como groupby.first), en su dtype."""
+    rows = np.arange(len(values))
+    first = _group_reduce(np.minimum, codes, n_groups, rows, values.notna().to_numpy())
+    first[first >= len(values)] = -1  # grupo sin valores -> nulo
+    return values.array.take(first, allow_fill=True)
+
+
+# Valores de Silver sobre los que se filtra en las agregaciones
+_EVENT_TYPES = ("combat_damage", "heal", "player_death")
+_ROLES = ("tank", "healer", "dps")
+
+
+@dataclass(frozen=True)
+class _SilverIndex:
+    """Factorización de un DataFrame Silver, compartida por los builders Gold."""
+
+    raid_codes: np.ndarray  # código de raid_id por fila (-1 = nulo)
+    raid_ids: pd.Index  # raid_id de cada código, ordenados
+    player_codes: np.ndarray  # código de source_player_id por fila (-1 = nulo)
+    player_ids: pd.Index  # source_player_id de cada código, ordenados
+    pair_codes: np.ndarray  # código (raid, jugador) por fila (-1 = nulo)
+    pair_raid: np.ndarray  # código de raid de cada par
+    pair_player: np.ndarray  # código de jugador de cada par
+    masks: dict[str, np.ndarray]  # event_type / target_entity_type / rol -> filas
+
+    def pair_codes_for(self, player_codes: np.ndarray) -> np.ndarray:
+        """Código de par (raid de la fila, jugador dado) por fila; -1 si no existe."""
+        n_players = max(len(self.player_ids), 1)
+        pair_keys = self.pair_raid * n_players + self.pair_player
+        keys = self.raid_codes.astype(np.int64) * n_players + player_codes
+        pos = np.searchsorted(pair_keys, keys).clip(max=max(len(pair_keys) - 1, 0))
+        found = (
+            (self.raid_codes >= 0)
+            & (player_codes >= 0)
+            & (pair_keys[pos] == keys if len(pair_keys) else False)
+        )
+        return np.where(found, pos, -1)
+
+
+def _prepare_indices(df_silver: pd.DataFrame) -> _SilverIndex:
+    """
+    Factoriza raid_id, source_player_id y el par (raid, jugador) una vez.
+
+    Los códigos salen ordenados, así que los pares quedan en el mismo orden
+    (raid_id, player_id) que produciría un groupby de pandas.
+    """
+    raid_codes, raid_ids = pd.factorize(df_silver["raid_id"], sort=True)
+    player_codes, player_ids = pd.factorize(df_silver["source_player_id"], sort=True)
+    n_players = max(len(player_ids), 1)
+
+    valid = (raid_codes >= 0) & (player_codes >= 0)
+    keys = raid_codes.astype(np.int64) * n_players + player_codes
+    pair_keys, inverse = np.unique(keys[valid], return_inverse=True)
+    pair_codes = np.full(len(keys), -1, dtype=np.intp)
+    pair_codes[valid] = inverse
+
+    masks = {
+        **_value_masks(df_silver["event_type"], _EVENT_TYPES),
+        **_value_masks(df_silver["target_entity_type"], ("boss",)),
+        **_value_masks(df_silver["source_player_role"], _ROLES),
+    }
+
+    return _SilverIndex(
+        raid_codes=raid_codes,
+        raid_ids=raid_ids,
+        player_codes=player_codes,
+        player_ids=player_ids,
+        pair_codes=pair_codes,
+        pair_raid=pair_keys // n_players,
+        pair_player=pair_keys % n_players,
+        masks=masks,
+    )
+
+
+def build_gold(df_silver: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Construye raid_summary y player_raid_stats en una sola llamada.
+
+    Equivale a build_raid_summary + build_player_raid_stats, pero la
+    factorización de raid_id / source_player_id se calcula una vez y la
+    comparten las dos agregaciones.
+
+    Devuelve
+    --------
+    (raid_summary, player_raid_stats)
+    """
+    idx = _prepare_indices(df_silver)
+    raid_summary = build_raid_summary(df_silver, idx=idx)
+    player_stats = build_player_raid_stats(df_silver, raid_summary, idx=idx)
+    return raid_summary, player_stats
+
+
+def build_raid_summary(
+    df_silver: pd.DataFrame, idx: _SilverIndex | None = None
+) -> pd.DataFrame:
     """
     Construye la tabla gold.raid_summary a partir de eventos Silver.
 
@@ -16,6 +207,8 @@ def build_raid_summary(df_silver: pd.DataFrame) -> pd.DataFrame:
         - damage_amount, healing_amount
         - target_entity_type, target_entity_health_pct_after
         - source_player_id, source_player_role
+    idx : _SilverIndex, opcional
+        Factorización ya calculada (la pasa build_gold).
 
     Devuelve
     --------
@@ -29,166 +222,107 @@ def build_raid_summary(df_silver: pd.DataFrame) -> pd.DataFrame:
         n_dps, max_concurrent_deaths
     """
 
-    # 1. Copia del dataset
-    df = df_silver.copy()
-
-    # 2.- Cálculo de agregados base por raid
-    # Duración y nº de jugadores
-    group = df.groupby("raid_id")
-
-    duration = (
-        group["timestamp"]
-        .agg(lambda s: (s.max() - s.min()).total_seconds() * 1000.0)
-        .rename("duration_ms")
-    )
-
-    n_players = group["source_player_id"].nunique().rename("n_players")
-
-    # Contar jugadores por rol (tank, healer, dps)
-    role_counts = (
-        df.groupby(["raid_id", "source_player_role"])["source_player_id"]
-        .nunique()
-        .unstack(fill_value=0)
-    )
-
-    # Asegurarnos de que las columnas existen aunque algún rol no aparezca
-    for role in ["tank", "healer", "dps"]:
-        if role not in role_counts.columns:
-            role_counts[role] = 0
-
-    role_counts = role_counts.reset_index()
-
-    # Renombrar columnas a n_tanks, n_healers, n_dps
-    role_counts = role_counts.rename(
-        columns={
-            "raid_id": "raid_id",
-            "tank": "n_tanks",
-            "healer": "n_healers",
-            "dps": "n_dps",
-        }
-    )
-
-    # event_date: mínimo event_date
-    event_date = group["event_date"].min().rename("event_date")
-
-    raid_base = pd.concat([duration, n_players, event_date], axis=1).reset_index()
-    raid_base = raid_base.rename(columns={"raid_id": "raid_id"})
-
-    # 3.- Daño y Curación total
-    damage = (
-        df[df["event_type"] == "combat_damage"]
-        .groupby("raid_id")["damage_amount"]
-        .sum()
-        .rename("total_damage")
-    )
-
-    healing = (
-        df[df["event_type"] == "heal"]
-        .groupby("raid_id")["healing_amount"]
-        .sum()
-        .rename("total_healing")
-    )
-
-    deaths = (
-        df[df["event_type"] == "player_death"]
-        .groupby("raid_id")["event_type"]
-        .count()
-        .rename("total_player_deaths")
-    )
-
-    # Juntar con raid_base
-    raid_base = (
-        raid_base.merge(damage, how="left", left_on="raid_id", right_index=True)
-        .merge(healing, how="left", left_on="raid_id", right_index=True)
-        .merge(deaths, how="left", left_on="raid_id", right_index=True)
-    )
-
-    # Añadir counts por rol
-    raid_base = raid_base.merge(
-        role_counts,
-        how="left",
-        on="raid_id",  # con on= en lugar de left_on/right_on evitas duplicados sin necesidad de drop
-    )
-
-    # Asegurar tipo entero
-    raid_base["n_tanks"] = raid_base["n_tanks"].astype("int64")
-    raid_base["n_healers"] = raid_base["n_healers"].astype("int64")
-    raid_base["n_dps"] = raid_base["n_dps"].astype("int64")
-
-    # Rellenar NaN por 0 donde toque
-    raid_base["total_damage"] = raid_base["total_damage"].fillna(0.0)
-    raid_base["total_healing"] = raid_base["total_healing"].fillna(0.0)
-    raid_base["total_player_deaths"] = (
-        raid_base["total_player_deaths"].fillna(0).astype("int64")
-    )
-
-    # 4.- boss_min_hp_pct
-    boss_events = df[df["target_entity_type"] == "boss"]
-
-    boss_min = (
-        boss_events.groupby("raid_id")["target_entity_health_pct_after"]
-        .min()
-        .rename("boss_min_hp_pct")
-    )
-
-    raid_base = raid_base.merge(
-        boss_min, how="left", left_on="raid_id", right_index=True
+    # 1. Códigos de raid (ordenados, -1 para nulos) sobre los que se reducen
+    #    arrays NumPy planos: una pasada por métrica, sin objetos groupby
+    if idx is None:
+        idx = _prepare_indices(df_silver)
+    raid_codes, raid_ids = idx.raid_codes, idx.raid_ids
+    n_raids = len(raid_ids)
+    masks = idx.masks
+
+    # 2.- Agregados numéricos por raid
+    total_damage = _group_sum(
+        raid_codes,
+        n_raids,
+        _float_values(df_silver["damage_amount"]),
+        masks["combat_damage"],
+    )
+    total_healing = _group_sum(
+        raid_codes,
+        n_raids,
+        _float_values(df_silver["healing_amount"]),
+        masks["heal"],
+    )
+    total_player_deaths = _group_count(raid_codes, n_raids, masks["player_death"])
+
+    # Duración: primer y último timestamp de cada raid (int64 ns, sin NaT)
+    # (cache=False: la columna ya suele venir tipada y la caché la recorre)
+    ts = pd.to_datetime(df_silver["timestamp"], utc=True, cache=False)
+    ts_ns = ts.to_numpy(dtype="datetime64[ns]").view("i8")
+    has_ts = ts.notna().to_numpy()
+    ts_min = _group_reduce(np.minimum, raid_codes, n_raids, ts_ns, has_ts)
+    ts_max = _group_reduce(np.maximum, raid_codes, n_raids, ts_ns, has_ts)
+    duration_ms = (ts_max - ts_min) / 1e6
+    duration_ms[_group_count(raid_codes, n_raids, has_ts) == 0] = np.nan
+
+    # event_date: mínimo event_date (códigos ordenados -> mínimo lexicográfico)
+    date_codes, dates = pd.factorize(df_silver["event_date"], sort=True)
+    first_date = _group_reduce(
+        np.minimum, raid_codes, n_raids, date_codes, date_codes >= 0
+    )
+    first_date[first_date >= len(dates)] = -1  # raid sin event_date -> nulo
+    event_date = dates.array.take(first_date, allow_fill=True)
+
+    # 3.- boss_min_hp_pct
+    boss_hp = _float_values(df_silver["target_entity_health_pct_after"])
+    boss_min_hp_pct = _group_reduce(
+        np.minimum,
+        raid_codes,
+        n_raids,
+        boss_hp,
+        masks["boss"] & ~np.isnan(boss_hp),
     )
 
     # Si alguna raid no tiene eventos de boss, ponemos 100 como default
-    raid_base["boss_min_hp_pct"] = raid_base["boss_min_hp_pct"].fillna(100.0)
-
-    # 5.- DPS y HPS
-    # Evitar división por cero
-    duration_seconds = raid_base["duration_ms"] / 1000.0
-    duration_seconds = duration_seconds.replace(0, np.nan)
-
-    raid_base["raid_dps"] = raid_base["total_damage"] / duration_seconds
-    raid_base["raid_hps"] = raid_base["total_healing"] / duration_seconds
-
-    raid_base["raid_dps"] = raid_base["raid_dps"].fillna(0.0)
-    raid_base["raid_hps"] = raid_base["raid_hps"].fillna(0.0)
-
-    # 6.- raid_outcome
-    T_MAX = 360000  # 6 minutos
-
-    cond_success_kill = (raid_base["boss_min_hp_pct"] == 0.0) & (
-        raid_base["duration_ms"] <= T_MAX
-    )
-    cond_success_almost = (raid_base["boss_min_hp_pct"] < 10.0) & (
-        raid_base["total_player_deaths"] <= raid_base["n_players"]
+    boss_min_hp_pct = np.where(np.isinf(boss_min_hp_pct), 100.0, boss_min_hp_pct)
+
+    # Cada par (raid, jugador) es un jugador distinto de esa raid
+    n_players = np.bincount(idx.pair_raid, minlength=n_raids)
+    # Jugadores únicos por rol: un bit por rol en cada fila (tank=1,
+    # healer=2, dps=4); el OR por par (raid, jugador) dice qué roles tuvo
+    # cada jugador, y cada rol se cuenta sobre los pares en una sola pasada
+    role_bits = np.zeros(len(raid_codes), dtype=np.uint8)
+    for bit, role_name in enumerate(_ROLES):
+        role_bits |= masks[role_name].astype(np.uint8) << np.uint8(bit)
+    pair_roles = _group_bit_or(idx.pair_codes, len(idx.pair_raid), role_bits)
+    n_tanks, n_healers, n_dps = (
+        np.bincount(idx.pair_raid[(pair_roles >> bit) & 1 == 1], minlength=n_raids)
+        for bit in range(len(_ROLES))
+    )
+
+    # 4.- DPS y HPS (duración 0 o desconocida -> 0, sin dividir por cero)
+    duration_seconds = duration_ms / 1000.0
+    has_duration = duration_seconds > 0
+
+    # 5.- Tabla final, construida de una vez con las columnas ya en orden
+    #     (con una sola raid por partición, insertar columna a columna costaba
+    #     más que las propias agregaciones)
+    return pd.DataFrame(
+        {
+            "raid_id": raid_ids,
+            "event_date": event_date,
+            "duration_ms": duration_ms,
+            "total_damage": total_damage,
+            "total_healing": total_healing,
+            "total_player_deaths": total_player_deaths,
+            "n_players": n_players,
+            "n_tanks": n_tanks,
+            "n_healers": n_healers,
+            "n_dps": n_dps,
+            "raid_dps": _safe_divide(total_damage, duration_seconds, has_duration),
+            "raid_hps": _safe_divide(total_healing, duration_seconds, has_duration),
+            "boss_min_hp_pct": boss_min_hp_pct,
+            "raid_outcome": _raid_outcome(
+                boss_min_hp_pct, duration_ms, total_player_deaths, n_players
+            ),
+        }
     )
 
-    raid_base["raid_outcome"] = np.where(
-        cond_success_kill | cond_success_almost,
-        "success",
-        "wipe",
-    )
-
-    # 7.- Selección de columnas
-    cols = [
-        "raid_id",
-        "event_date",
-        "duration_ms",
-        "total_damage",
-        "total_healing",
-        "total_player_deaths",
-        "n_players",
-        "n_tanks",
-        "n_healers",
-        "n_dps",
-        "raid_dps",
-        "raid_hps",
-        "boss_min_hp_pct",
-        "raid_outcome",
-    ]
-
-    raid_summary = raid_base[cols].copy()
-    return raid_summary
-
 
 def build_player_raid_stats(
-    df_silver: pd.DataFrame, raid_summary: pd.DataFrame
+    df_silver: pd.DataFrame,
+    raid_summary: pd.DataFrame,
+    idx: _SilverIndex | None = None,
 ) -> pd.DataFrame:
     """
     Construye la tabla gold.player_raid_stats a partir de eventos Silver
@@ -201,6 +335,8 @@ def build_player_raid_stats(
     raid_summary : pd.DataFrame
         Resultado de build_raid_summary, usado para obtener duration_ms
         y totales de daño/curación por raid.
+    idx : _SilverIndex, opcional
+        Factorización ya calculada (la pasa build_gold).
 
     Devuelve
     --------
@@ -217,236 +353,90 @@ def build_player_raid_stats(
         deaths_per_10min (opcional),
         role_activity_flag (opcional).
     """
-    # Copia defensiva
-    df = df_silver.copy()
-
-    # Daño total por jugador
-    damage_per_player = (
-        df[df["event_type"] == "combat_damage"]
-        .groupby(["raid_id", "source_player_id"])["damage_amount"]
-        .sum()
-        .rename("damage_total")
-    )
-
-    # Contar eventos de daño y curación
-    damage_events = (
-        df[df["event_type"] == "combat_damage"]
-        .groupby(["raid_id", "source_player_id"])["event_type"]
-        .count()
-        .rename("damage_events")
-    )
-
-    # Curación total por jugador
-    healing_per_player = (
-        df[df["event_type"] == "heal"]
-        .groupby(["raid_id", "source_player_id"])["healing_amount"]
-        .sum()
-        .rename("healing_total")
-    )
-
-    healing_events = (
-        df[df["event_type"] == "heal"]
-        .groupby(["raid_id", "source_player_id"])["event_type"]
-        .count()
-        .rename("healing_events")
-    )
-
-    # Muertes del jugador (cuando el jugador es TARGET de player_death)
-    # Cuidado: en eventos de muerte, el target es el muerto, no el source
-    # Ajusta según tu schema: si usas target_entity_id para el muerto,
-    # agrupa por (raid_id, target_entity_id). Si tu schema usa source_player_id
-    # como el que muere, usa source_player_id.
-
-    # Supongo que en tu schema el muerto es source_player_id en event_type player_death
-    player_deaths = (
-        df[df["event_type"] == "player_death"]
-        .groupby(["raid_id", "source_player_id"])["event_type"]
-        .count()
-        .rename("player_deaths")
-    )
-
-    # 3. Metadatos del jugador (name, class, role) - tomar primer valor
-    player_meta = (
-        df.groupby(["raid_id", "source_player_id"])
-        .agg(
-            {
-                "source_player_name": "first",
-                "source_player_class": "first",
-                "source_player_role": "first",
-            }
-        )
-        .rename(
-            columns={
-                "source_player_name": "player_name",
-                "source_player_class": "player_class",
-                "source_player_role": "player_role",
-            }
-        )
-    )
+    # 1. Un grupo por par (raid_id, source_player_id), en orden de groupby
+    if idx is None:
+        idx = _prepare_indices(df_silver)
+    pairs = idx.pair_codes
+    n_pairs = len(idx.pair_raid)
+
+    is_damage = idx.masks["combat_damage"]
+    is_heal = idx.masks["heal"]
+    damage = _float_values(df_silver["damage_amount"])
+    healing = _float_values(df_silver["healing_amount"])
+
+    # 2. Daño y curación total por jugador, y nº de eventos de cada tipo
+    damage_total = _group_sum(pairs, n_pairs, damage, is_damage)
+    healing_total = _group_sum(pairs, n_pairs, healing, is_heal)
+    damage_events = _group_count(pairs, n_pairs, is_damage)
+    healing_events = _group_count(pairs, n_pairs, is_heal)
+
+    # Muertes del jugador: en player_death el muerto es source_player_id
+    player_deaths = _group_count(pairs, n_pairs, idx.masks["player_death"])
+
+    # Eventos críticos (is_critical_hit == True) de daño o curación
+    is_crit = df_silver["is_critical_hit"].to_numpy(dtype=bool, na_value=False)
+    crit_events = _group_count(pairs, n_pairs, (is_damage | is_heal) & is_crit)
+
+    # Daño recibido: el jugador es target_entity_id de un combat_damage
+    target_codes = idx.player_ids.get_indexer(df_silver["target_entity_id"])
+    total_damage_received = _group_sum(
+        idx.pair_codes_for(target_codes), n_pairs, damage, is_damage
+    )
+
+    # 3. raid_id, event_date, duración y totales de raid desde raid_summary:
+    #    fila de raid_summary por código de raid (un lookup por raid, no por
+    #    jugador) y de ahí un take posicional por par, sin merge
+    summary_row = pd.Index(raid_summary["raid_id"]).get_indexer(idx.raid_ids)[
+        idx.pair_raid
+    ]
 
-    # 4. Construir base
-    player_base = player_meta.copy()
-    player_base = player_base.reset_index().rename(
-        columns={
-            "raid_id": "raid_id",
-            "source_player_id": "player_id",
+    def _from_summary(col: str):
+        return raid_summary[col].array.take(summary_row, allow_fill=True)
+
+    duration_ms = np.asarray(_from_summary("duration_ms"), dtype="float64")
+    raid_damage = np.asarray(_from_summary("total_damage"), dtype="float64")
+    raid_healing = np.asarray(_from_summary("total_healing"), dtype="float64")
+
+    # 4. DPS y HPS (duración 0 o desconocida -> 0)
+    duration_seconds = duration_ms / 1000.0
+    has_duration = duration_seconds > 0
+
+    # 5. crit_rate sobre los eventos de daño + curación del jugador
+    total_events = damage_events + healing_events
+
+    # 6. Tabla final, construida de una vez con las columnas ya en orden;
+    #    metadatos del jugador (name, class, role) = primer valor no nulo
+    return pd.DataFrame(
+        {
+            "raid_id": _from_summary("raid_id"),
+            "event_date": _from_summary("event_date"),
+            "player_id": idx.player_ids.array.take(idx.pair_player),
+            "player_name": _group_first(
+                pairs, n_pairs, df_silver["source_player_name"]
+            ),
+            "player_class": _group_first(
+                pairs, n_pairs, df_silver["source_player_class"]
+            ),
+            "player_role": _group_first(
+                pairs, n_pairs, df_silver["source_player_role"]
+            ),
+            "damage_total": damage_total,
+            "healing_total": healing_total,
+            "damage_events": damage_events,
+            "healing_events": healing_events,
+            "player_deaths": player_deaths,
+            "crit_events": crit_events,
+            "crit_rate": _safe_divide(crit_events, total_events, total_events > 0),
+            "total_damage_received": total_damage_received,
+            "dps": _safe_divide(damage_total, duration_seconds, has_duration),
+            "hps": _safe_divide(healing_total, duration_seconds, has_duration),
+            "damage_share": _safe_divide(damage_total, raid_damage, raid_damage > 0),
+            "healing_share": _safe_divide(
+                healing_total, raid_healing, raid_healing > 0
+            ),
         }
     )
 
-    # 5. Añadir damage, healing, deaths
-    player_base = (
-        player_base.merge(
-            damage_per_player,
-            how="left",
-            left_on=["raid_id", "player_id"],
-            right_index=True,
-        )
-        .merge(
-            healing_per_player,
-            how="left",
-            left_on=["raid_id", "player_id"],
-            right_index=True,
-        )
-        .merge(
-            player_deaths,
-            how="left",
-            left_on=["raid_id", "player_id"],
-            right_index=True,
-        )
-        .merge(
-            damage_events,
-            how="left",
-            left_on=["raid_id", "player_id"],
-            right_index=True,
-        )
-        .merge(
-            healing_events,
-            how="left",
-            left_on=["raid_id", "player_id"],
-            right_index=True,
-        )
-    )
-
-    # Rellenar NaN
-    player_base["damage_total"] = player_base["damage_total"].fillna(0.0)
-    player_base["healing_total"] = player_base["healing_total"].fillna(0.0)
-    player_base["player_deaths"] = (
-        player_base["player_deaths"].fillna(0).astype("int64")
-    )
-    player_base["damage_events"] = (
-        player_base["damage_events"].fillna(0).astype("int64")
-    )
-    player_base["healing_events"] = (
-        player_base["healing_events"].fillna(0).astype("int64")
-    )
-
-    # 6. Añadir event_date y duration_ms desde raid_summary
-    player_base = player_base.merge(
-        raid_summary[["raid_id", "event_date", "duration_ms"]],
-        how="left",
-        on="raid_id",
-    )
-
-    # 7. Calcular DPS y HPS
-    duration_seconds = player_base["duration_ms"] / 1000.0
-    duration_seconds = duration_seconds.replace(0, np.nan)
-
-    player_base["dps"] = player_base["damage_total"] / duration_seconds
-    player_base["hps"] = player_base["healing_total"] / duration_seconds
-
-    player_base["dps"] = player_base["dps"].fillna(0.0)
-    player_base["hps"] = player_base["hps"].fillna(0.0)
-
-    # 8. Contar eventos críticos (is_critical_hit == True)
-    crit_events = (
-        df[
-            (df["event_type"].isin(["combat_damage", "heal"]))
-            & (df["is_critical_hit"].fillna(False))
-        ]
-        .groupby(["raid_id", "source_player_id"])["event_type"]
-        .count()
-        .rename("crit_events")
-    )
-
-    # Merge
-    player_base = player_base.merge(
-        crit_events, how="left", left_on=["raid_id", "player_id"], right_index=True
-    )
-    player_base["crit_events"] = player_base["crit_events"].fillna(0).astype("int64")
-
-    # Calcular crit_rate
-    total_events = player_base["damage_events"] + player_base["healing_events"]
-    player_base["crit_rate"] = np.where(
-        total_events > 0, player_base["crit_events"] / total_events, 0.0
-    )
-
-    damage_received = (
-        df[df["event_type"] == "combat_damage"]
-        .groupby(["raid_id", "target_entity_id"])["damage_amount"]
-        .sum()
-        .rename("total_damage_received")
-    )
-
-    # Merge usando target_entity_id = player_id
-    player_base = player_base.merge(
-        damage_received,
-        how="left",
-        left_on=["raid_id", "player_id"],
-        right_index=True,
-    )
-    player_base["total_damage_received"] = player_base["total_damage_received"].fillna(
-        0.0
-    )
-
-    # Merge con raid_summary para obtener totales de raid
-    player_base = player_base.merge(
-        raid_summary[["raid_id", "total_damage", "total_healing"]],
-        how="left",
-        on="raid_id",
-    )
-
-    # Calcular shares (las columnas de raid se llaman total_damage y total_healing)
-    player_base["damage_share"] = np.where(
-        player_base["total_damage"] > 0,
-        player_base["damage_total"] / player_base["total_damage"],
-        0.0,
-    )
-
-    player_base["healing_share"] = np.where(
-        player_base["total_healing"] > 0,
-        player_base["healing_total"] / player_base["total_healing"],
-        0.0,
-    )
-
-    # Limpiar columnas auxiliares (ahora se llaman total_damage y total_healing)
-    player_base = player_base.drop(columns=["total_damage", "total_healing"])
-
-    # . Seleccionar columnas
-    cols = [
-        "raid_id",
-        "event_date",
-        "player_id",
-        "player_name",
-        "player_class",
-        "player_role",
-        "damage_total",
-        "healing_total",
-        "damage_events",
-        "healing_events",
-        "player_deaths",
-        "crit_events",
-        "crit_rate",
-        "total_damage_received",
-        "dps",
-        "hps",
-        "damage_share",
-        "healing_share",
-    ]
-
-    player_stats = player_base[cols].copy()
-
-    return player_stats
-
 
 def apply_raid_outcome_rule(raid_summary: pd.DataFrame) -> pd.DataFrame:
     """
@@ -458,5 +448,15 @@ def apply_raid_outcome_rule(raid_summary: pd.DataFrame) -> pd.DataFrame:
           o bien:
             boss_min_hp_pct < 10 y total_player_deaths <= n_players
         - wipe en caso contrario.
+
+    Devuelve una copia superficial de raid_summary con la columna
+    raid_outcome, calculada con operaciones vectoriales sobre arrays NumPy.
     """
-    ...
+    out = raid_summary.copy(deep=False)
+    out["raid_outcome"] = _raid_outcome(
+        _float_values(out["boss_min_hp_pct"]),
+        _float_values(out["duration_ms"]),
+        out["total_player_deaths"].to_numpy(),
+        out["n_players"].to_numpy(),
+    )
+    return out
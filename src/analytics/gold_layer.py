@@ -23,12 +23,14 @@ from __future__ import annotations
 
 import io
 import logging
+from functools import cache
 from typing import Any
 
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+import pyarrow.parquet as pq
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from src.analytics.aggregators import build_player_raid_stats, build_raid_summary
+from src.analytics.aggregators import build_gold
 from src.config import Config
 from src.schemas.gold_schemas import (
     DimPlayerSchema,
@@ -56,20 +58,53 @@ _PATH_TEMPLATES: dict[str, str] = {
 }
 
 
+# Columnas Silver de baja cardinalidad que solo se usan para filtrar en las
+# agregaciones: como category ocupan 1 byte/fila y cada comparación
+# (event_type == "heal") se resuelve sobre los códigos enteros
+_CATEGORICAL_COLUMNS: tuple[str, ...] = ("event_type", "target_entity_type")
+
+# Columnas Silver que consumen los agregadores y las dimensiones Gold.
+# Parquet es columnar: solo se descomprimen estas (raid_id / event_date se
+# reinyectan desde la ruta de la partición)
+_SILVER_GOLD_COLUMNS: tuple[str, ...] = (
+    "timestamp",
+    "event_type",
+    "source_player_id",
+    "source_player_name",
+    "source_player_class",
+    "source_player_role",
+    "target_entity_id",
+    "target_entity_type",
+    "target_entity_health_pct_after",
+    "damage_amount",
+    "healing_amount",
+    "is_critical_hit",
+)
+
+
 # ============================================================================
 # HELPER: validación de DataFrame contra schema Pydantic
 # ============================================================================
 
 
+@cache
+def _rows_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter(list[schema]) construido una sola vez por schema."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
 def _validate_dataframe(
     df: pd.DataFrame, schema: type[BaseModel], table_name: str
 ) -> None:
     """
-    Valida cada fila de un DataFrame contra un schema Pydantic v2.
+    Valida todas las filas de un DataFrame contra un schema Pydantic v2.
 
     Lanza ValueError si hay filas inválidas, adjuntando todos los errores
     encontrados para diagnóstico completo (no falla en el primer error).
 
+    Las filas se validan en una sola llamada a pydantic-core sobre
+    df.to_dict("records"): sin iterrows ni un model_validate por fila.
+
     Parámetros
     ----------
     df         : DataFrame a validar.
@@ -78,12 +113,17 @@ def _validate_dataframe(
     """
     errors: list[str] = []
 
-    for idx, row in df.iterrows():
-        try:
-            schema.model_validate(row.to_dict())
-        except ValidationError as exc:
+    try:
+        _rows_adapter(schema).validate_python(df.to_dict("records"))
+    except ValidationError as exc:
+        # Agrupar por posición de fila (loc[0]) y reportar con el índice del df
+        by_row: dict[int, list[dict[str, Any]]] = {}
+        for err in exc.errors(include_url=False):
+            pos, *loc = err["loc"]
+            by_row.setdefault(int(pos), []).append({**err, "loc": tuple(loc)})
+        for pos, row_errors in sorted(by_row.items()):
             errors.append(
-                f"  Fila {idx}: {exc.error_count()} error(s) → {exc.errors(include_url=False)}"
+                f"  Fila {df.index[pos]}: {len(row_errors)} error(s) → {row_errors}"
             )
 
     if errors:
@@ -130,7 +170,8 @@ class GoldLayerETL:
 
         Returns
         -------
-        pd.DataFrame con todos los eventos de esa partición.
+        pd.DataFrame con todos los eventos de esa partición, solo con las
+        columnas que usa Gold (_SILVER_GOLD_COLUMNS + raid_id / event_date).
 
         Raises
         ------
@@ -158,8 +199,14 @@ class GoldLayerETL:
                 response = self.storage.s3.get_object(
                     Bucket=self.silver_bucket, Key=obj_key
                 )
-                parquet_bytes = response["Body"].read()
-                df = pd.read_parquet(io.BytesIO(parquet_bytes))
+                buffer = io.BytesIO(response["Body"].read())
+                # Proyección de columnas: el footer dice cuáles existen y
+                # solo se leen las que usa Gold
+                present = set(pq.read_schema(buffer).names)
+                df = pd.read_parquet(
+                    buffer,
+                    columns=[c for c in _SILVER_GOLD_COLUMNS if c in present],
+                )
                 dfs.append(df)
                 logger.debug("  Leído: %s (%d filas)", obj_key, len(df))
             except Exception as exc:
@@ -181,6 +228,9 @@ class GoldLayerETL:
             )
 
         df_result = pd.concat(dfs, ignore_index=True)
+        df_result = df_result.astype(
+            {c: "category" for c in _CATEGORICAL_COLUMNS if c in df_result.columns}
+        )
 
         # Reinyección de partition keys — Pandas no las infiere desde la ruta Hive-style
         df_result["raid_id"] = raid_id
@@ -463,8 +513,8 @@ class GoldLayerETL:
         Flujo:
             Silver Parquet
                 → normalizar columnas
-                → build_raid_summary()     → fact_raid_summary
-                → build_player_raid_stats() → fact_player_raid_stats
+                → build_gold()             → fact_raid_summary
+                                             + fact_player_raid_stats
                 → _build_dim_player()      → dim_player
                 → _build_dim_raid()        → dim_raid
                 → validar schemas
@@ -491,17 +541,19 @@ class GoldLayerETL:
             df_silver = df_silver[
                 df_silver["source_player_id"].str.startswith("player_")
             ].copy()
+            # Roles en minúsculas una sola vez: los schemas Gold los validan
+            # como Literal sin normalizar fila a fila
+            df_silver["source_player_role"] = df_silver[
+                "source_player_role"
+            ].str.lower()
             logger.info(
                 "[Gold ETL] Eventos de jugadores reales tras filtro: %d", len(df_silver)
             )
 
             logger.info("[Gold ETL] Silver leído: %d eventos.", len(df_silver))
 
-            # ── 3. Construir tablas de hechos ─────────────────────────────
-            fact_raid_summary = build_raid_summary(df_silver)
-            fact_player_raid_stats = build_player_raid_stats(
-                df_silver, fact_raid_summary
-            )
+            # ── 3. Construir tablas de hechos (factorización compartida) ──
+            fact_raid_summary, fact_player_raid_stats = build_gold(df_silver)
 
             logger.info(
                 "[Gold ETL] Agregaciones OK — raids: %d | jugadores: %d",
@@ -25,3 +25,8 @@ class Config:
 
     # Pipeline Settings
     MAX_EVENTS_PER_BATCH = int(os.getenv("MAX_EVENTS_PER_BATCH", 1000))
+
+    # Receiver: subida a Bronze en segundo plano (responde 202 tras encolar)
+    ASYNC_UPLOADS = os.getenv("RECEIVER_ASYNC_UPLOADS", "False").lower() == "true"
+    UPLOAD_WORKERS = int(os.getenv("RECEIVER_UPLOAD_WORKERS", 8))
+    MAX_PENDING_UPLOADS = int(os.getenv("RECEIVER_MAX_PENDING_UPLOADS", 64))
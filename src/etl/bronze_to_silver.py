@@ -2,9 +2,11 @@
 ETL Principal: Bronze -> Silver.
 Lectura de JSON crudo -> Transformación Pandas -> Escritura Parquet particionado.
 
-Soporta dos formatos de entrada:
+Soporta cuatro formatos de entrada:
 1. Envelope (HTTP): {"batch_id": "...", "events": [...]}
 2. Array directo (S3): [...]
+3. Parquet (HTTP con S3_BRONZE_FORMAT=parquet): batch_<uuid>.parquet
+4. NDJSON gzip (save_batches): batches_<uuid>_<n>.ndjson.gz, un envelope por línea
 
 v2.1: Resolución de timestamps en microsegundos para compatibilidad nativa con Spark/Delta (Fase 7)
 """
@@ -21,7 +23,7 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from src.etl.transformers import SilverTransformer
-from src.storage.minio_client import MinIOStorageClient
+from src.storage.minio_client import MinIOStorageClient, decode_bronze_body
 
 
 SILVER_SCHEMA = pa.schema(
@@ -64,6 +66,10 @@ SILVER_SCHEMA = pa.schema(
     ]
 )  # Nota: event_date y raid_id se excluyen — se usan como partición y se dropean antes de escribir
 
+# batch_id a partir del nombre del objeto Bronze (batch_<uuid>.json|parquet,
+# o batches_<uuid>_<n>.ndjson.gz para varios batches agrupados)
+_BATCH_ID_RE = re.compile(r"batch(?:es)?_([^/]+?)\.(?:json|parquet|ndjson\.gz)$")
+
 
 class BronzeToSilverETL:
     def __init__(self) -> None:
@@ -73,10 +79,10 @@ class BronzeToSilverETL:
         self.transformer = SilverTransformer()
 
     def read_bronze_batch(self, batch_key: str) -> dict[str, Any] | list[Any]:
-        """Descarga y deserializa el JSON de Bronze."""
+        """Descarga y deserializa el JSON de Bronze (plano o gzip)."""
         try:
             response = self.storage.get_object(self.bucket_bronze, batch_key)
-            content = response.read().decode("utf-8")
+            content = decode_bronze_body(response.read()).decode("utf-8")
             data = json.loads(content)
             if not isinstance(data, dict | list):
                 raise ValueError(f"Expected JSON object, got {type(content).__name__}")
@@ -84,6 +90,23 @@ class BronzeToSilverETL:
         except Exception as err:
             raise OSError(f"Error leyendo Bronze [{batch_key}]: {err}") from err
 
+    def read_bronze_ndjson(self, batch_key: str) -> list[dict[str, Any]]:
+        """Descarga un objeto de save_batches: un envelope JSON por línea."""
+        try:
+            response = self.storage.get_object(self.bucket_bronze, batch_key)
+            content = decode_bronze_body(response.read())
+            return [json.loads(line) for line in content.splitlines() if line]
+        except Exception as err:
+            raise OSError(f"Error leyendo Bronze [{batch_key}]: {err}") from err
+
+    def read_bronze_parquet(self, batch_key: str) -> pd.DataFrame:
+        """Descarga un batch Parquet de Bronze directamente como DataFrame."""
+        try:
+            response = self.storage.get_object(self.bucket_bronze, batch_key)
+            return pq.read_table(io.BytesIO(response.read())).to_pandas()
+        except Exception as err:
+            raise OSError(f"Error leyendo Bronze [{batch_key}]: {err}") from err
+
     def save_silver(
         self, df: pd.DataFrame, raid_id: str, batch_id: str
     ) -> dict[str, Any]:  # ← anotación completa (mypy)
@@ -162,31 +185,51 @@ class BronzeToSilverETL:
         """
         print(f"⚡ [ETL] Procesando: {bronze_key}")
 
-        # 1. READ
-        raw_data = self.read_bronze_batch(bronze_key)
-
-        # 2. EXTRAER BATCH_ID (filename como fuente de verdad)
-        filename_match = re.search(r"batch_([^/]+?)\.json$", bronze_key)
+        # 1. EXTRAER BATCH_ID (filename como fuente de verdad)
+        filename_match = _BATCH_ID_RE.search(bronze_key)
         if filename_match:
             batch_id = filename_match.group(1)
         else:
             batch_id = hashlib.md5(bronze_key.encode()).hexdigest()[:8]
             print(f"  [WARN] batch_id derivado de hash para: {bronze_key}")
 
-        # 3. NORMALIZAR FORMATO
-        if isinstance(raw_data, dict):
-            events_list = raw_data.get("events", [])
-            if not events_list:
-                return {"status": "skipped", "reason": "no_events_in_envelope"}
-        elif isinstance(raw_data, list):
-            events_list = raw_data
+        # 2. READ + 3. NORMALIZAR FORMATO
+        if bronze_key.endswith(".parquet"):
+            # Columnar: sin parseo JSON ni DataFrame fila a fila
+            df_raw = self.read_bronze_parquet(bronze_key)
+            if df_raw.empty:
+                return {"status": "skipped", "reason": "empty_parquet"}
+        elif bronze_key.endswith(".ndjson.gz"):
+            # Varios batches en un objeto: se transforman juntos y van a una
+            # sola parte Silver (part-<uuid del primero>_<n>.parquet)
+            events_list = [
+                event
+                for envelope in self.read_bronze_ndjson(bronze_key)
+                for event in envelope.get("events", [])
+            ]
             if not events_list:
-                return {"status": "skipped", "reason": "empty_array"}
+                return {"status": "skipped", "reason": "no_events_in_ndjson"}
+            df_raw = pd.DataFrame(events_list)
         else:
-            return {"status": "error", "reason": f"unknown_json_type: {type(raw_data)}"}  # type: ignore[unreachable]
+            raw_data = self.read_bronze_batch(bronze_key)
+            if isinstance(raw_data, dict):
+                events_list = raw_data.get("events", [])
+                if not events_list:
+                    return {"status": "skipped", "reason": "no_events_in_envelope"}
+            elif isinstance(raw_data, list):
+                events_list = raw_data
+                if not events_list:
+                    return {"status": "skipped", "reason": "empty_array"}
+            else:
+                # JSON válido pero escalar (p. ej. "42"): el tipo declarado no
+                # lo contempla, de ahí el ignore
+                return {  # type: ignore[unreachable]
+                    "status": "error",
+                    "reason": f"unknown_json_type: {type(raw_data)}",
+                }
+            df_raw = pd.DataFrame(events_list)
 
         # 4. TRANSFORM
-        df_raw = pd.DataFrame(events_list)
         df_silver, metadata = self.transformer.transform_pipeline(df_raw)
 
         # 5. WRITE
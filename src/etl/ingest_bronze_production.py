@@ -19,6 +19,7 @@ Uso:
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from tqdm import tqdm
@@ -30,6 +31,8 @@ BRONZE_ROOT = Path("data/bronze/production")
 BUCKET = "bronze"
 S3_PREFIX = "wow_raid_events/v1"
 INGEST_DATE = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+# put_object es I/O que libera el GIL: varias subidas en paralelo
+UPLOAD_WORKERS = 16
 
 
 def ensure_bucket(storage: MinIOStorageClient, bucket: str) -> None:
@@ -69,6 +72,24 @@ def collect_files(root: Path) -> list[tuple[str, Path]]:
     return pairs
 
 
+def upload_file(storage: MinIOStorageClient, raid_id: str, fpath: Path) -> int:
+    """Sube un archivo JSON a Bronze y devuelve los bytes transferidos."""
+    raw_bytes = fpath.read_bytes()
+    storage.s3.put_object(
+        Bucket=BUCKET,
+        Key=build_s3_key(raid_id, fpath.name),
+        Body=raw_bytes,
+        ContentType="application/json",
+        Metadata={
+            "raid-id": raid_id,
+            "ingest-date": INGEST_DATE,
+            "source-file": fpath.name,
+            "source-system": "ingest_bronze_production.py",
+        },
+    )
+    return len(raw_bytes)
+
+
 def main(dry_run: bool = False) -> None:
     print("=" * 65)
     print("  Ingesta Bronze — JSON local → MinIO")
@@ -112,25 +133,18 @@ def main(dry_run: bool = False) -> None:
     failed = 0
     total_bytes = 0
 
-    with tqdm(total=len(files), desc="Subiendo a Bronze", unit="archivo") as pbar:
-        for raid_id, fpath in files:
-            s3_key = build_s3_key(raid_id, fpath.name)
+    with (
+        tqdm(total=len(files), desc="Subiendo a Bronze", unit="archivo") as pbar,
+        ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool,
+    ):
+        futures = {
+            pool.submit(upload_file, storage, raid_id, fpath): fpath
+            for raid_id, fpath in files
+        }
+        for future, fpath in futures.items():
             try:
-                raw_bytes = fpath.read_bytes()
-                storage.s3.put_object(
-                    Bucket=BUCKET,
-                    Key=s3_key,
-                    Body=raw_bytes,
-                    ContentType="application/json",
-                    Metadata={
-                        "raid-id": raid_id,
-                        "ingest-date": INGEST_DATE,
-                        "source-file": fpath.name,
-                        "source-system": "ingest_bronze_production.py",
-                    },
-                )
+                total_bytes += future.result()
                 success += 1
-                total_bytes += len(raw_bytes)
 
             except Exception as e:
                 failed += 1
@@ -5,6 +5,7 @@ Encapsulan la lógica de limpieza, validación y enriquecimiento.
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -13,8 +14,9 @@ def _normalize_quality_flags(val: object) -> list[str]:
     Coerce un valor de data_quality_flags a list[int] garantizado.
     Señal digital paquetizada: cada flag es un entero discreto.
     Cubre tres casos: lista de ints, lista de strings, None/NaN/vacío.
+    Las columnas list de Arrow (Bronze Parquet) llegan como np.ndarray.
     """
-    if isinstance(val, list):
+    if isinstance(val, list | np.ndarray):
         return [str(x) for x in val if x is not None]
     return []
 
@@ -69,7 +69,7 @@ def main():
     for etype, count in sorted(event_counts.items()):
         pct = count / len(events) * 100
         print(f"    {etype:20s}: {count:6d} ({pct:5.2f}%)")
-    print("  Pydantic validation: 100% (schema-on-write)")
+    print("  Pydantic validation: en ingesta (receptor, schema-on-write)")
     print()
 
     # Prepare output
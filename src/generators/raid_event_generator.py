@@ -13,14 +13,21 @@ Cambios:
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate, islice, repeat
+from typing import Any
 from datetime import datetime, timedelta, timezone
+import os
 import random
 import uuid
 
 import numpy as np
+from pydantic_core import PydanticUndefined
 
 from src.schemas.eventos_schema import (
+    BATCH_ADAPTER,
     WoWRaidEvent,
     EventType,
     PlayerRole,
@@ -33,6 +40,46 @@ from src.schemas.eventos_schema import (
 from src.generators.class_profiles import SPEC_PROFILES
 from src.generators.class_profiles import SPECS_BY_ROLE, RAID_ROLE_WEIGHTS
 
+# Sistema emisor: idéntico en todos los eventos generados
+SOURCE_SYSTEM = "wow-raid-addon-v2.0"
+
+# Ability genérica cuando la spec no tiene ninguna del tipo pedido
+_FALLBACK_ABILITY = {
+    "ability_id": "generic_001",
+    "ability_name": "Auto Attack",
+    "ability_school": DamageSchool.PHYSICAL,
+}
+
+
+def _ability_fields(ability: dict) -> dict:
+    """Ability del catálogo como campos ability_* del evento (school ya en enum)."""
+    return {
+        "ability_id": ability["ability_id"],
+        "ability_name": ability["ability_name"],
+        "ability_school": DamageSchool(ability["ability_school"]),
+    }
+
+
+# Catálogo aplanado una sola vez: (class, spec, "damage"|"heal") -> abilities
+# listas para volcar en el evento. Nunca vacío: cae al fallback genérico.
+_ABILITY_FIELDS: dict[tuple[str, str, str], tuple[dict, ...]] = {
+    (player_class, spec, kind): (
+        tuple(_ability_fields(a) for a in abilities) or (_FALLBACK_ABILITY,)
+    )
+    for (player_class, spec), profile in SPEC_PROFILES.items()
+    for kind, abilities in profile["abilities"].items()
+}
+
+# value -> miembro, para no pasar por EnumType.__call__ en cada evento de maná
+_RESOURCE_TYPES: dict[str, ResourceType] = {m.value: m for m in ResourceType}
+
+# Valor de relleno por columna para generate_event_columns: default del schema,
+# o None si el campo no tiene default estático
+_COLUMN_DEFAULTS: dict[str, object] = {
+    name: None if f.default is PydanticUndefined else f.default
+    for name, f in WoWRaidEvent.model_fields.items()
+}
+
 
 @dataclass(frozen=True)
 class Player:
@@ -47,9 +94,14 @@ class Player:
     role: str = field(default="", init=False)
     dps_type: str | None = field(default=None, init=False)
     resource_type: str = field(default="", init=False)
+    # Campos source_player_* del evento, ya como enums: se empaquetan una vez
+    # por jugador y no en cada evento
+    source_fields: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
 
     def __post_init__(self) -> None:
-        """Deriva role, dps_type y resource_type de SPEC_PROFILES."""
+        """Deriva role, dps_type, resource_type y source_fields de SPEC_PROFILES."""
         spec_key = (self.player_class, self.spec)
 
         # Validación defensiva: si la spec no existe, falla rápido (fail-fast)
@@ -65,6 +117,13 @@ class Player:
         object.__setattr__(self, "role", profile["role"])
         object.__setattr__(self, "dps_type", profile["dps_type"])
         object.__setattr__(self, "resource_type", profile["resource_type"])
+        self.source_fields.update(
+            source_player_id=self.player_id,
+            source_player_name=self.name,
+            source_player_role=PlayerRole(self.role),
+            source_player_class=PlayerClass(self.player_class),
+            source_player_level=self.level,
+        )
 
 
 @dataclass
@@ -77,6 +136,11 @@ class BossPhase:
     damage_multiplier: float = 1.0
     healing_multiplier: float = 1.0
     death_probability: float = 0.0
+    # Derivado: flag de calidad de los eventos de esta fase, formateado una vez
+    quality_flag: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.quality_flag = f"boss_phase_{self.phase_number}"
 
 
 @dataclass
@@ -125,6 +189,342 @@ class RaidSession:
     end_time: datetime
     players: list[Player]
     phases: list[BossPhase] = field(default_factory=list)
+    # Derivado: constante para toda la sesión, se formatea una sola vez
+    encounter_id: str = field(default="", init=False)
+    # Derivado: jugadores agrupados por rol, para selecciones filtradas por rol
+    players_by_role: dict[str, list[Player]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "encounter_id", f"{self.boss_id}_encounter")
+        for p in self.players:
+            self.players_by_role.setdefault(p.role, []).append(p)
+
+
+def _ns_to_datetimes(ts_ns: np.ndarray) -> list[datetime]:
+    """
+    Materializa un vector int64 (ns desde epoch) como datetimes UTC.
+
+    Un ``map`` de ``datetime.fromtimestamp`` sobre los segundos ya pasados a
+    float de Python en bloque: construye el datetime aware directamente, sin
+    bucle Python ni el ``replace(tzinfo=...)`` (caro por los kwargs) por evento.
+    """
+    seconds = (ts_ns / 1e9).tolist()
+    return list(map(datetime.fromtimestamp, seconds, repeat(timezone.utc)))
+
+
+def _encounter_ms(session: RaidSession, timestamp: datetime) -> int:
+    """Milisegundos transcurridos desde el inicio del encounter (camino escalar)."""
+    return int((timestamp - session.start_time).total_seconds() * 1000)
+
+
+def _crit_multipliers(u: np.ndarray, p, lo, hi) -> np.ndarray:
+    """
+    Multiplicador de crítico a partir de una sola uniforme por evento.
+
+    Crítico si ``u < p``; en ese caso ``u / p`` vuelve a ser uniforme en
+    [0, 1) y se reescala a [lo, hi). Sin crítico el multiplicador es 1.0, así
+    que ``is_crit`` equivale a ``mult > 1.0``. ``p``/``lo``/``hi`` pueden ser
+    escalares o arrays del tamaño de ``u``.
+    """
+    return np.where(u < p, lo + (u / p) * (hi - lo), 1.0)
+
+
+# Sampler: devuelve un bloque de n muestras en una sola llamada vectorizada
+_Sampler = Callable[[np.random.Generator, int], np.ndarray]
+
+# Variables aleatorias escalares que consumen los creadores de eventos, por nombre
+_DRAW_SAMPLERS: dict[str, _Sampler] = {
+    "dmg_crit_mult": lambda rng, n: _crit_multipliers(rng.random(n), 0.18, 1.5, 2.2),
+    "dmg_hp_before": lambda rng, n: rng.uniform(10, 100, n),
+    "dmg_hp_after": lambda rng, n: rng.uniform(5, 99, n),
+    "heal_crit_mult": lambda rng, n: _crit_multipliers(rng.random(n), 0.12, 1.3, 1.9),
+    "heal_hp_before": lambda rng, n: rng.uniform(20, 85, n),
+    "heal_hp_after": lambda rng, n: rng.uniform(50, 100, n),
+    "mana_before": lambda rng, n: rng.uniform(20, 80, n),
+    "mana_regen_rate": lambda rng, n: rng.uniform(50, 150, n),
+    "death_roll": lambda rng, n: rng.random(n),
+    "death_hp_before": lambda rng, n: rng.uniform(0, 25, n),
+    "ability_u": lambda rng, n: rng.random(n),
+    "player_u": lambda rng, n: rng.random(n),
+    # Latencias: normal truncada en 0, ya como int
+    "lat_server": lambda rng, n: np.maximum(rng.normal(45, 10, n), 0).astype(np.int64),
+    "lat_client": lambda rng, n: np.maximum(rng.normal(50, 15, n), 0).astype(np.int64),
+}
+
+
+# Importe base de daño/curación: (media, std, mínimo, máximo) tras el multiplicador
+_AMOUNT_PARAMS: dict[str, tuple[float, float, float, float]] = {
+    "damage": (15000.0, 3000.0, 5000.0, 100000.0),
+    "heal": (9500.0, 2500.0, 3000.0, 40000.0),
+}
+
+
+def _scaled_clipped_normal(
+    mean: float, std: float, scale: float, lo: float, hi: float
+) -> _Sampler:
+    """Sampler de normal(mean, std) * scale recortada a [lo, hi], todo in-place."""
+
+    def sample(rng: np.random.Generator, n: int) -> np.ndarray:
+        out = rng.normal(mean, std, n)
+        out *= scale
+        return np.clip(out, lo, hi, out=out)
+
+    return sample
+
+
+class _DrawBuffer:
+    """
+    Muestras aleatorias pre-generadas en bloque y consumidas de una en una.
+
+    Cada stream se rellena con una única llamada vectorizada al Generator
+    cuando se agota; ``draw`` es un ``list.pop`` sobre floats/bools de Python,
+    sin cruzar a C por cada muestra.
+    """
+
+    # Tope por stream: hay ~20 streams y algunos se consumen poco (maná,
+    # muertes); bloques mayores solo ocupan memoria
+    MAX_BLOCK = 1 << 16
+
+    def __init__(
+        self,
+        rng: np.random.Generator,
+        samplers: dict[str, _Sampler],
+        block_size: int = 4096,
+    ) -> None:
+        self._rng = rng
+        self._samplers: dict[Hashable, _Sampler] = {
+            name: sampler for name, sampler in samplers.items()
+        }
+        self.block_size = block_size
+        self._pools: dict[Hashable, list] = {name: [] for name in samplers}
+
+    def __contains__(self, name: Hashable) -> bool:
+        return name in self._pools
+
+    def add(self, name: Hashable, sampler: _Sampler) -> None:
+        """Registra un stream nuevo (p.ej. uno por multiplicador de fase)."""
+        self._samplers[name] = sampler
+        self._pools[name] = []
+
+    def reserve(self, n: int) -> None:
+        """Dimensiona los próximos rellenos para ``n`` eventos (acotado)."""
+        self.block_size = min(max(n, 1024), self.MAX_BLOCK)
+
+    def draw(self, name: Hashable) -> Any:
+        pool = self._pools[name]
+        if not pool:
+            pool.extend(self._samplers[name](self._rng, self.block_size).tolist())
+        return pool.pop()
+
+
+def _arrow_event_schema():
+    """Schema Arrow equivalente a WoWRaidEvent (enums como string, UUID como string)."""
+    import pyarrow as pa
+
+    types = {
+        "event_id": pa.string(),
+        "event_type": pa.string(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "raid_id": pa.string(),
+        "encounter_id": pa.string(),
+        "encounter_duration_ms": pa.int64(),
+        "source_player_id": pa.string(),
+        "source_player_name": pa.string(),
+        "source_player_role": pa.string(),
+        "source_player_class": pa.string(),
+        "source_player_level": pa.int64(),
+        "ability_id": pa.string(),
+        "ability_name": pa.string(),
+        "ability_school": pa.string(),
+        "damage_amount": pa.float64(),
+        "healing_amount": pa.float64(),
+        "is_critical_hit": pa.bool_(),
+        "critical_multiplier": pa.float64(),
+        "is_resisted": pa.bool_(),
+        "is_blocked": pa.bool_(),
+        "is_absorbed": pa.bool_(),
+        "target_entity_id": pa.string(),
+        "target_entity_name": pa.string(),
+        "target_entity_type": pa.string(),
+        "target_entity_health_pct_before": pa.float64(),
+        "target_entity_health_pct_after": pa.float64(),
+        "resource_type": pa.string(),
+        "resource_amount_before": pa.float64(),
+        "resource_amount_after": pa.float64(),
+        "resource_regeneration_rate": pa.float64(),
+        "ingestion_timestamp": pa.timestamp("us", tz="UTC"),
+        "source_system": pa.string(),
+        "data_quality_flags": pa.list_(pa.string()),
+        "server_latency_ms": pa.int64(),
+        "client_latency_ms": pa.int64(),
+    }
+    return pa.schema([pa.field(name, types[name]) for name in _COLUMN_DEFAULTS])
+
+
+def _rows_to_columns(rows: Iterable[dict]) -> dict[str, list]:
+    """Transpone filas (dict de campos) a una lista por campo de WoWRaidEvent."""
+    rows = list(rows)
+    return {
+        name: [row.get(name, default) for row in rows]
+        for name, default in _COLUMN_DEFAULTS.items()
+    }
+
+
+def _uuid4_block(n: int) -> list[uuid.UUID]:
+    """
+    ``n`` UUID v4 a partir de una única lectura de ``os.urandom``.
+
+    Equivale a n llamadas a ``uuid.uuid4()`` pero con una sola syscall. Sale
+    del SO y no del Generator sembrado: dos runs con la misma semilla no deben
+    repetir event_id.
+    """
+    raw = os.urandom(16 * n)
+    return [uuid.UUID(bytes=raw[i : i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+def _build_alias_table(
+    weights: dict[str, float],
+) -> tuple[list[float], list[int], list[str]]:
+    """
+    Tabla alias de Walker/Vose para muestrear ``weights`` en O(1).
+
+    Devuelve (prob, alias, etypes): se elige una columna j uniforme y se acepta
+    ``etypes[j]`` con probabilidad ``prob[j]``; si no, ``etypes[alias[j]]``.
+    Se devuelven listas Python (no arrays) porque el consumo es escalar, evento
+    a evento, y la indexación de listas es bastante más barata.
+    """
+    etypes = list(weights.keys())
+    k = len(etypes)
+    total = sum(weights.values())
+    scaled = [w * k / total for w in weights.values()]
+    prob = [1.0] * k
+    alias = list(range(k))
+
+    small = [j for j, p in enumerate(scaled) if p < 1.0]
+    large = [j for j, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, g = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1.0 - scaled[s]
+        (small if scaled[g] < 1.0 else large).append(g)
+    # Lo que queda (por redondeo) tiene probabilidad efectiva 1
+    for j in small + large:
+        prob[j] = 1.0
+
+    return prob, alias, etypes
+
+
+def _sample_event_types(
+    prob: np.ndarray,
+    alias: np.ndarray,
+    spec_rows: np.ndarray,
+    u_col: np.ndarray,
+    u_acc: np.ndarray,
+) -> np.ndarray:
+    """
+    Kernel numérico: muestreo alias de todos los event_type de una vez.
+
+    ``prob``/``alias`` son las tablas apiladas (una fila por spec) y
+    ``spec_rows`` la fila de cada evento. No depende del estado del combate
+    (HP del boss, fase), así que se resuelve entero antes del bucle.
+
+    Returns:
+        Índice de event_type por evento (columna de ``prob``)
+    """
+    k = prob.shape[1]
+    j = np.minimum((u_col * k).astype(np.intp), k - 1)
+    accept = u_acc < prob[spec_rows, j]
+    return np.where(accept, j, alias[spec_rows, j])
+
+
+@lru_cache(maxsize=256)
+def _event_templates(
+    raid_id: str, encounter_id: str, boss_id: str, boss_name: str
+) -> dict[EventType, dict]:
+    """
+    Campos constantes de cada tipo de evento para una sesión (evaluación parcial).
+
+    Todo lo que no depende del evento concreto (contexto de raid, boss como
+    source/target, flags fijos, sentinelas None) se resuelve una vez por sesión;
+    los creadores solo añaden los campos variables. Las listas mutables
+    (data_quality_flags) se crean siempre por evento, nunca aquí.
+    """
+    common = {
+        "raid_id": raid_id,
+        "encounter_id": encounter_id,
+        "is_resisted": False,
+        "is_blocked": False,
+        "is_absorbed": False,
+        "source_system": SOURCE_SYSTEM,
+    }
+    boss_target = {
+        "target_entity_id": boss_id,
+        "target_entity_name": boss_name,
+        "target_entity_type": EntityType.BOSS,
+    }
+    boss_source = {
+        "source_player_id": boss_id,
+        "source_player_name": boss_name,
+        "source_player_role": None,
+        "source_player_class": None,
+        "source_player_level": None,
+    }
+    no_amounts = {
+        "damage_amount": None,
+        "healing_amount": None,
+        "is_critical_hit": False,
+        "critical_multiplier": 1.0,
+    }
+    return {
+        EventType.COMBAT_DAMAGE: {
+            **common,
+            **boss_target,
+            "event_type": EventType.COMBAT_DAMAGE,
+            "healing_amount": None,
+        },
+        EventType.HEAL: {
+            **common,
+            "event_type": EventType.HEAL,
+            "target_entity_type": EntityType.PLAYER,
+            "damage_amount": None,
+        },
+        EventType.SPELL_CAST: {
+            **common,
+            **boss_target,
+            **no_amounts,
+            "event_type": EventType.SPELL_CAST,
+        },
+        EventType.MANA_REGENERATION: {
+            **common,
+            **no_amounts,
+            "event_type": EventType.MANA_REGENERATION,
+            "target_entity_type": EntityType.PLAYER,
+        },
+        EventType.PLAYER_DEATH: {
+            **common,
+            **boss_source,
+            **no_amounts,
+            "event_type": EventType.PLAYER_DEATH,
+            "target_entity_type": EntityType.PLAYER,
+            "target_entity_health_pct_after": 0.0,
+        },
+        EventType.BOSS_PHASE: {
+            **common,
+            **boss_source,
+            **boss_target,
+            **no_amounts,
+            "event_type": EventType.BOSS_PHASE,
+        },
+    }
+
+
+def _session_templates(session: RaidSession) -> dict[EventType, dict]:
+    return _event_templates(
+        session.raid_id, session.encounter_id, session.boss_id, session.boss_name
+    )
 
 
 class WoWEventGenerator:
@@ -133,10 +533,50 @@ class WoWEventGenerator:
     Compatible con Pydantic v2 + schema validation.
     """
 
-    def __init__(self, seed: int = 42) -> None:
+    def __init__(self, seed: int = 42, strict: bool = False) -> None:
+        """
+        Args:
+            seed: Semilla de los generadores aleatorios
+            strict: Si True, cada evento pasa por la validación completa de
+                Pydantic (útil en tests/debug). Por defecto los eventos se
+                construyen con model_construct: los datos sintéticos ya cumplen
+                el schema y la validación real ocurre en el receptor.
+        """
         self.seed = seed
+        self.strict = strict
         self._rng = np.random.default_rng(seed)
         self._py_rng = random.Random(seed)
+        self._draws = _DrawBuffer(self._rng, _DRAW_SAMPLERS)
+        self._event_ids: list[uuid.UUID] = []
+        self._batch_now: datetime | None = None
+
+        # Pesos acumulados de rol: random.choices hace un bisect por jugador
+        self._role_names = list(RAID_ROLE_WEIGHTS)  # ["tank", "healer", "dps"]
+        self._cum_role_weights = list(accumulate(RAID_ROLE_WEIGHTS.values()))
+
+        self._new_event: Callable[..., WoWRaidEvent]
+        if strict:
+            self._new_event = WoWRaidEvent
+        else:
+            self._new_event = WoWRaidEvent.model_construct
+
+        # Tablas alias por spec, apiladas en matrices (fila = spec) para
+        # samplear todos los event_type en bloque con _sample_event_types
+        self._spec_row = {spec_key: i for i, spec_key in enumerate(SPEC_PROFILES)}
+        self._event_type_names = list(
+            next(iter(SPEC_PROFILES.values()))["event_weights"]
+        )
+        tables = [
+            _build_alias_table(
+                {
+                    e: profile["event_weights"].get(e, 0.0)
+                    for e in self._event_type_names
+                }
+            )
+            for profile in SPEC_PROFILES.values()
+        ]
+        self._alias_prob = np.array([t[0] for t in tables])
+        self._alias_idx = np.array([t[1] for t in tables], dtype=np.intp)
 
         # Catálogo de habilidades
 
@@ -144,17 +584,17 @@ class WoWEventGenerator:
             {
                 "ability_id": "boss001",
                 "ability_name": "Lava Burst",
-                "ability_school": "fire",
+                "ability_school": DamageSchool.FIRE,
             },
             {
                 "ability_id": "boss002",
                 "ability_name": "Shadow Strike",
-                "ability_school": "shadow",
+                "ability_school": DamageSchool.SHADOW,
             },
             {
                 "ability_id": "boss003",
                 "ability_name": "AOE Flame Wave",
-                "ability_school": "fire",
+                "ability_school": DamageSchool.FIRE,
             },
         ]
 
@@ -176,13 +616,12 @@ class WoWEventGenerator:
 
         players: list[Player] = []
 
-        role_names = list(RAID_ROLE_WEIGHTS.keys())  # ["tank", "healer", "dps"]
-        role_weights = list(RAID_ROLE_WEIGHTS.values())  # [0.10,   0.20,     0.70]
-
-        for i in range(num_players):
-            # Paso 1: samplear rol
-            role = str(self._rng.choice(role_names, p=role_weights))
+        # Paso 1: samplear los roles de toda la raid de una vez
+        roles = self._py_rng.choices(
+            self._role_names, cum_weights=self._cum_role_weights, k=num_players
+        )
 
+        for i, role in enumerate(roles):
             # Paso 2: samplear spec dentro de ese rol
             # SPECS_BY_ROLE["dps"] es una lista de tuplas: [("mage","fire"), ("rogue","combat"), ...]
             available_specs = SPECS_BY_ROLE[role]
@@ -252,6 +691,105 @@ class WoWEventGenerator:
             num_events: Número total de eventos
             event_distribution: Distribución de tipos de evento
         """
+        rows = self._generate_rows(session, num_events, event_distribution)
+        if self.strict:
+            # Validación en lote: una sola llamada al core de Pydantic
+            return BATCH_ADAPTER.validate_python(
+                rows, context={"now": datetime.now(timezone.utc)}
+            )
+        return [WoWRaidEvent.from_trusted(row) for row in rows]
+
+    def generate_event_columns(
+        self, session: RaidSession, num_events: int = 1000
+    ) -> dict[str, list]:
+        """
+        Genera eventos como una lista por campo, sin instanciar modelos Pydantic.
+
+        Las filas se generan igual que en generate_events y después se
+        transponen a columnas en el orden del schema, pensado para sinks
+        columnares (Parquet/Arrow). Los campos que no aplican a un tipo de
+        evento llevan su default del schema.
+
+        Returns:
+            dict campo -> lista de valores (misma longitud para todas)
+        """
+        return _rows_to_columns(self._iter_rows(session, num_events))
+
+    def write_events_parquet(
+        self,
+        session: RaidSession,
+        num_events: int,
+        path: str,
+        chunk_size: int = 100_000,
+    ) -> int:
+        """
+        Genera eventos y los escribe a Parquet sin materializar modelos Pydantic.
+
+        Consume las filas en trozos de ``chunk_size``: cada trozo se transpone
+        a columnas, se escribe como un record batch (un row group) y se
+        descarta, así que nunca hay más de un trozo de filas en memoria.
+        pyarrow se importa aquí: es dependencia del ETL, no del generador.
+
+        Returns:
+            Número de filas escritas
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = _arrow_event_schema()
+        rows = self._iter_rows(session, num_events)
+        n_rows = 0
+
+        with pq.ParquetWriter(path, schema, compression="snappy") as writer:
+            while chunk := list(islice(rows, chunk_size)):
+                columns = _rows_to_columns(chunk)
+                columns["event_id"] = [str(v) for v in columns["event_id"]]
+                writer.write_batch(
+                    pa.record_batch(
+                        [pa.array(columns[f.name], type=f.type) for f in schema],
+                        schema=schema,
+                    )
+                )
+                n_rows += len(chunk)
+        return n_rows
+
+    def _generate_rows(
+        self,
+        session: RaidSession,
+        num_events: int,
+        event_distribution: dict | None = None,
+    ) -> list[dict]:
+        """Filas (dict de campos) listas para construir eventos."""
+        return list(self._iter_rows(session, num_events, event_distribution))
+
+    def _iter_rows(
+        self,
+        session: RaidSession,
+        num_events: int,
+        event_distribution: dict | None = None,
+    ) -> Iterator[dict]:
+        """Igual que _generate_rows pero perezoso: las filas se producen bajo demanda."""
+        # Un único reloj de ingesta para todo el lote: sin syscall por evento
+        # y coherente dentro del batch
+        self._batch_now = datetime.now(timezone.utc)
+        try:
+            # Si no hay fases, generar con patrón uniforme (backward compatibility)
+            if not session.phases:
+                yield from self._iter_simple_rows(session, num_events)
+            else:
+                yield from self._iter_phased_rows(
+                    session, num_events, event_distribution
+                )
+        finally:
+            self._batch_now = None
+
+    def _iter_phased_rows(
+        self,
+        session: RaidSession,
+        num_events: int,
+        event_distribution: dict | None = None,
+    ) -> Iterator[dict]:
+        """Bucle principal: eventos guiados por el HP del boss y sus fases."""
 
         # Distribución default
         if event_distribution is None:
@@ -264,18 +802,13 @@ class WoWEventGenerator:
                 "player_death": 0.02,
             }
 
-        events: list[WoWRaidEvent] = []
-
-        # Si no hay fases, generar con patrón uniforme (backward compatibility)
-        if not session.phases:
-            return self._generate_simple_events(session, num_events)
-
         # Calcular max_hp proporcional al daño esperado de la raid
         avg_damage_per_event = 15_000
         estimated_damage_events = int(num_events * 0.50)
         max_hp = avg_damage_per_event * estimated_damage_events * 1.3
 
-        # Instanciar tracker y generar todos los timestamps de golpe
+        # Tracker como fuente del estado inicial y los umbrales de fase, y
+        # generar todos los timestamps de golpe
         boss_tracker = BossHPTracker(max_hp=max_hp)
 
         start_ts = session.start_time.timestamp()
@@ -284,134 +817,266 @@ class WoWEventGenerator:
         all_timestamps = self._generate_realistic_timestamps(
             start_ts=start_ts, end_ts=end_ts, count=num_events, burst_intensity=0.5
         )
-
-        for ts in all_timestamps:
-            timestamp = datetime.fromtimestamp(float(ts), tz=timezone.utc)
-
-            # Fase actual según HP del boss — no según tiempo
-            phase_index = min(boss_tracker.current_phase_index, len(session.phases) - 1)
-            phase = session.phases[phase_index]
+        self._draws.reserve(num_events)
+
+        # Timestamps como int64 ns: la duración del encounter es una resta
+        # vectorial y los datetimes se materializan en bloque, no por evento
+        ts_ns = (all_timestamps * 1e9).astype(np.int64)
+        duration_ms_arr = (ts_ns - int(start_ts * 1e9)) // 1_000_000
+        timestamps = _ns_to_datetimes(ts_ns)
+        durations = duration_ms_arr.tolist()
+
+        # Índices de jugador (actor y objetivo) sorteados en bloque: un único
+        # _rng.integers en lugar de un random.choice por evento
+        players = session.players
+        player_idx = self._rng.integers(0, len(players), size=num_events)
+        target_idx = self._rng.integers(0, len(players), size=num_events)
+
+        # event_type de todos los eventos en bloque (muestreo alias vectorizado)
+        player_rows = np.array(
+            [self._spec_row[(p.player_class, p.spec)] for p in players], dtype=np.intp
+        )
+        etype_codes = _sample_event_types(
+            self._alias_prob,
+            self._alias_idx,
+            player_rows[player_idx],
+            self._rng.random(num_events),
+            self._rng.random(num_events),
+        ).tolist()
+        etype_names = self._event_type_names
+        p_idx, t_idx = player_idx.tolist(), target_idx.tolist()
+
+        # HP del boss en locales: misma lógica que BossHPTracker.register_damage
+        # sin llamada a método ni properties por evento de daño. Los umbrales
+        # de fase se pasan a HP absoluto una sola vez.
+        boss_hp = boss_tracker.current_hp
+        phase_idx = boss_tracker.current_phase_index
+        max_tracker_phase = len(boss_tracker.phase_thresholds) - 2
+        threshold_hp = [t * max_hp / 100.0 for t in boss_tracker.phase_thresholds]
+        hp_to_pct = 100.0 / max_hp if max_hp else 0.0
+
+        # Fase actual según HP del boss — no según tiempo. Solo cambia al
+        # registrar daño, así que se resuelve ahí y no en cada evento
+        last_phase_index = len(session.phases) - 1
+        phase = session.phases[min(phase_idx, last_phase_index)]
+
+        for i, timestamp in enumerate(timestamps):
+            duration_ms = durations[i]
 
             # 1. Elegir jugador
-            player = self._pick_player(session)
+            player = players[p_idx[i]]
 
-            # 2. Obtener pesos de su spec y samplear event_type
-            weights = SPEC_PROFILES[(player.player_class, player.spec)]["event_weights"]
-            event_types = list(weights.keys())
-            event_probs = list(weights.values())
-            etype = str(self._rng.choice(event_types, p=event_probs))
+            # 2. event_type ya muestreado con la tabla alias de su spec
+            etype = etype_names[etype_codes[i]]
 
             # 3. Dispatch
             if etype == "combat_damage":
-                hp_before_hit = boss_tracker.hp_pct
-                ev = self._create_damage_event(player, session, timestamp, phase)
-                if ev.damage_amount:
-                    phase_changed = boss_tracker.register_damage(ev.damage_amount)
-                    if phase_changed:
-                        new_phase_index = min(
-                            boss_tracker.current_phase_index, len(session.phases) - 1
-                        )
-                        new_phase = session.phases[new_phase_index]
-                        events.append(
-                            self._create_boss_phase_event(
-                                session,
-                                timestamp,
-                                new_phase,
-                                hp_pct_before=hp_before_hit,
-                                hp_pct_after=boss_tracker.hp_pct,
-                            )
+                row = self._damage_row(player, session, timestamp, phase, duration_ms)
+                damage = row["damage_amount"]
+                if damage:
+                    hp_before_hit = boss_hp
+                    boss_hp = max(0.0, boss_hp - damage)
+                    if (
+                        phase_idx < max_tracker_phase
+                        and boss_hp <= threshold_hp[phase_idx + 1]
+                    ):
+                        phase_idx += 1
+                        phase = session.phases[min(phase_idx, last_phase_index)]
+                        yield self._boss_phase_row(
+                            session,
+                            timestamp,
+                            phase,
+                            hp_pct_before=hp_before_hit * hp_to_pct,
+                            hp_pct_after=boss_hp * hp_to_pct,
+                            encounter_duration_ms=duration_ms,
                         )
             elif etype == "heal":
-                ev = self._create_heal_event(player, session, timestamp, phase)
+                row = self._heal_row(
+                    player,
+                    session,
+                    timestamp,
+                    phase,
+                    duration_ms,
+                    target=players[t_idx[i]],
+                )
             elif etype == "spell_cast":
-                ev = self._create_spell_cast_event(player, session, timestamp, phase)
+                row = self._spell_cast_row(
+                    player, session, timestamp, phase, duration_ms
+                )
             elif etype == "mana_regen":
-                ev = self._create_mana_regen_event(player, session, timestamp)
+                row = self._mana_regen_row(player, session, timestamp, duration_ms)
             elif etype == "player_death":
-                ev = self._create_player_death_event(player, session, timestamp, phase)
+                row = self._player_death_row(
+                    player,
+                    session,
+                    timestamp,
+                    phase,
+                    duration_ms,
+                    target=players[t_idx[i]],
+                )
             else:
                 continue
 
-            events.append(ev)
-        return events
+            yield row
 
-    def _generate_simple_events(
+    def _iter_simple_rows(
         self, session: RaidSession, num_events: int
-    ) -> list[WoWRaidEvent]:
-        """Generación simple (backward compatibility con v1)."""
+    ) -> Iterator[dict]:
+        """
+        Generación simple (backward compatibility con v1).
+
+        Fase única con multiplicadores 1.0, así que todas las muestras se
+        sacan en bloque con NumPy y el bucle solo ensambla las filas.
+        """
         start_ts = session.start_time.timestamp()
         end_ts = session.end_time.timestamp()
-        timestamps = np.linspace(start_ts, end_ts, num_events)
-
-        # Crear fase dummy
-        dummy_phase = BossPhase(
-            phase_number=1,
-            phase_name="Single Phase",
-            duration_s=int((session.end_time - session.start_time).total_seconds()),
-            damage_multiplier=1.0,
-            healing_multiplier=1.0,
-            death_probability=0.0,
+        ts_ns = (np.linspace(start_ts, end_ts, num_events) * 1e9).astype(np.int64)
+        duration_ms_arr = (ts_ns - int(start_ts * 1e9)) // 1_000_000
+        timestamps = _ns_to_datetimes(ts_ns)
+
+        rng = self._rng
+        n = num_events
+        players = session.players
+        player_idx = rng.integers(0, len(players), size=n)
+        target_idx = rng.integers(0, len(players), size=n)
+        ability_u = rng.random(n)
+
+        # Rama daño/curación y todas sus muestras, vectorizadas
+        is_dmg = rng.random(n) < 0.70
+        amount = np.where(
+            is_dmg,
+            np.clip(rng.normal(15000, 3000, n), 5000, 100000),
+            np.clip(rng.normal(9500, 2500, n), 3000, 40000),
         )
-
-        events: list[WoWRaidEvent] = []
-        for ts in timestamps:
-            timestamp = datetime.fromtimestamp(float(ts), tz=timezone.utc)
-            player = self._pick_player(session)
-
-            if self._rng.random() < 0.70:
-                ev = self._create_damage_event(player, session, timestamp, dummy_phase)
+        crit_mult = _crit_multipliers(
+            rng.random(n),
+            np.where(is_dmg, 0.18, 0.12),
+            np.where(is_dmg, 1.5, 1.3),
+            np.where(is_dmg, 2.2, 1.9),
+        )
+        is_crit = crit_mult > 1.0
+        hp_before = np.where(is_dmg, rng.uniform(10, 100, n), rng.uniform(20, 85, n))
+        hp_after = np.where(is_dmg, rng.uniform(5, 99, n), rng.uniform(50, 100, n))
+        lat_server = np.maximum(rng.normal(45, 10, n), 0.0).astype(np.int64)
+        lat_client = np.maximum(rng.normal(50, 15, n), 0.0).astype(np.int64)
+
+        # tolist() una vez por columna: escalares Python nativos sin boxing numpy
+        durations = duration_ms_arr.tolist()
+        p_idx, t_idx, ab_u = (
+            player_idx.tolist(),
+            target_idx.tolist(),
+            ability_u.tolist(),
+        )
+        dmg_flags, amounts = is_dmg.tolist(), amount.tolist()
+        crits, mults = is_crit.tolist(), crit_mult.tolist()
+        hp_b, hp_a = hp_before.tolist(), hp_after.tolist()
+        lat_s, lat_c = lat_server.tolist(), lat_client.tolist()
+
+        for i in range(n):
+            player = players[p_idx[i]]
+            if dmg_flags[i]:
+                fields = self._damage_fields(
+                    player,
+                    session,
+                    timestamps[i],
+                    durations[i],
+                    self._get_ability(player, "damage", ab_u[i]),
+                    amounts[i],
+                    crits[i],
+                    mults[i],
+                    hp_b[i],
+                    hp_a[i],
+                )
             else:
-                ev = self._create_heal_event(player, session, timestamp, dummy_phase)
-
-            events.append(ev)
-
-        return events
+                fields = self._heal_fields(
+                    player,
+                    players[t_idx[i]],
+                    session,
+                    timestamps[i],
+                    durations[i],
+                    self._get_ability(player, "heal", ab_u[i]),
+                    amounts[i],
+                    crits[i],
+                    mults[i],
+                    hp_b[i],
+                    hp_a[i],
+                )
+            fields["server_latency_ms"] = lat_s[i]
+            fields["client_latency_ms"] = lat_c[i]
+            yield fields
 
     def _generate_realistic_timestamps(
         self, start_ts: float, end_ts: float, count: int, burst_intensity: float = 0.5
     ) -> np.ndarray:
-        """Genera timestamps con distribución no uniforme."""
-        beta_samples = self._rng.beta(a=2, b=2 - burst_intensity, size=count)
-        timestamps = start_ts + beta_samples * (end_ts - start_ts)
-        return np.sort(timestamps)
+        """
+        Genera timestamps con distribución no uniforme.
+
+        Beta(2, 2 - burst_intensity) escalada al encounter. Se ordena la
+        muestra en [0, 1) y se escala in-place: la transformación afín conserva
+        el orden y así no se crean arrays intermedios.
+        """
+        timestamps = self._rng.beta(a=2, b=2 - burst_intensity, size=count)
+        timestamps.sort()
+        timestamps *= end_ts - start_ts
+        timestamps += start_ts
+        return timestamps
 
     def _pick_player(self, session: RaidSession, role: str | None = None) -> Player:
         """Selecciona un jugador (opcionalmente por rol)."""
+        candidates = session.players
         if role:
-            candidates = [p for p in session.players if p.role == role]
-            if candidates:
-                return self._py_rng.choice(candidates)
-        return self._py_rng.choice(session.players)
+            candidates = session.players_by_role.get(role) or candidates
+        return candidates[int(self._draws.draw("player_u") * len(candidates))]
 
-    def _latency_ms(self, mean: float, std: float) -> int:
-        """Genera latencia con distribución normal."""
-        v = float(self._rng.normal(loc=mean, scale=std))
-        return int(max(0.0, v))
+    def _ingestion_now(self) -> datetime:
+        """Timestamp de ingesta: el del lote en curso, o el reloj si es suelto."""
+        return self._batch_now or datetime.now(timezone.utc)
+
+    def _next_event_id(self) -> uuid.UUID:
+        """Siguiente event_id del pool (rellenado en bloque con _uuid4_block)."""
+        if not self._event_ids:
+            self._event_ids = _uuid4_block(self._draws.block_size)
+        return self._event_ids.pop()
+
+    def _draw_amount(self, kind: str, multiplier: float) -> float:
+        """
+        Importe de daño/curación ya escalado por la fase y recortado.
 
-    def _get_ability(self, player: Player, ability_type: str) -> dict:
+        Hay un stream por (tipo, multiplicador): el escalado y el clip se
+        hacen vectorizados al rellenar el bloque, no por evento.
+        """
+        key = (kind, multiplier)
+        if key not in self._draws:
+            mean, std, lo, hi = _AMOUNT_PARAMS[kind]
+            self._draws.add(key, _scaled_clipped_normal(mean, std, multiplier, lo, hi))
+        return float(self._draws.draw(key))
+
+    def _get_ability(
+        self, player: Player, ability_type: str, u: float | None = None
+    ) -> dict:
         """
         Devuelve una ability aleatoria del catálogo de la spec del jugador.
 
         Args:
             player: El jugador que ejecuta la ability
             ability_type: "damage" o "heal"
+            u: Uniforme [0, 1) ya sorteada (caminos vectorizados); si es None
+               se sortea aquí
 
         Returns:
-            dict con ability_id, ability_name, ability_school
+            dict con ability_id, ability_name, ability_school (compartido: no
+            mutar)
         """
-        spec_key = (player.player_class, player.spec)
-        abilities = SPEC_PROFILES[spec_key]["abilities"][ability_type]
-
-        # Fallback: si la lista está vacía (ej. un healer pidiendo damage abilities
-        # y no tiene ninguna), devolvemos una ability genérica
-        if not abilities:
-            return {
-                "ability_id": "generic_001",
-                "ability_name": "Auto Attack",
-                "ability_school": "physical",
-            }
+        abilities = _ABILITY_FIELDS[(player.player_class, player.spec, ability_type)]
 
-        return self._py_rng.choice(abilities)
+        # Fallback: si la spec no tiene abilities del tipo pedido (ej. un healer
+        # pidiendo damage abilities), el catálogo ya trae la ability genérica
+        if len(abilities) == 1:
+            return abilities[0]
+
+        if u is None:
+            u = self._draws.draw("ability_u")
+        return abilities[int(u * len(abilities))]
 
     # ===== CREADORES DE EVENTOS =====
 
@@ -421,54 +1086,78 @@ class WoWEventGenerator:
         session: RaidSession,
         timestamp: datetime,
         phase: BossPhase,
+        encounter_duration_ms: int | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de daño."""
-        source = player
-        ability = self._get_ability(player, "damage")
-
-        base_damage = float(self._rng.normal(loc=15000, scale=3000))
-        damage = float(np.clip(base_damage * phase.damage_multiplier, 5000, 100000))
+        return self._new_event(
+            **self._damage_row(player, session, timestamp, phase, encounter_duration_ms)
+        )
 
-        is_crit = bool(self._rng.binomial(n=1, p=0.18))
-        crit_mult = float(self._rng.uniform(1.5, 2.2)) if is_crit else 1.0
+    def _damage_row(
+        self,
+        player: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+    ) -> dict:
+        """Campos de un evento de daño (incluye muestreo)."""
+        ability = self._get_ability(player, "damage")
 
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
+        draw = self._draws.draw
+        damage = self._draw_amount("damage", phase.damage_multiplier)
+
+        crit_mult = draw("dmg_crit_mult")
+        is_crit = crit_mult > 1.0
+
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
+
+        fields = self._damage_fields(
+            player,
+            session,
+            timestamp,
+            encounter_duration_ms,
+            ability,
+            damage,
+            is_crit,
+            crit_mult,
+            draw("dmg_hp_before"),
+            draw("dmg_hp_after"),
         )
+        fields["server_latency_ms"] = self._draws.draw("lat_server")
+        fields["client_latency_ms"] = self._draws.draw("lat_client")
+        return fields
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.COMBAT_DAMAGE,
-            timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
-            encounter_duration_ms=encounter_duration_ms,
-            source_player_id=source.player_id,
-            source_player_name=source.name,
-            source_player_role=PlayerRole(player.role),
-            source_player_class=PlayerClass(player.player_class),
-            source_player_level=source.level,
-            target_entity_id=session.boss_id,
-            target_entity_name=session.boss_name,
-            target_entity_type=EntityType.BOSS,
-            target_entity_health_pct_before=float(self._rng.uniform(10, 100)),
-            target_entity_health_pct_after=float(self._rng.uniform(5, 99)),
-            ability_id=ability["ability_id"],
-            ability_name=ability["ability_name"],
-            ability_school=ability["ability_school"],
-            damage_amount=damage,
-            healing_amount=None,
-            is_critical_hit=is_crit,
-            critical_multiplier=crit_mult,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
-            data_quality_flags=[],
-        )
+    def _damage_fields(
+        self,
+        source: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        encounter_duration_ms: int,
+        ability: dict,
+        damage: float,
+        is_crit: bool,
+        crit_mult: float,
+        hp_before: float,
+        hp_after: float,
+    ) -> dict:
+        """Campos de un evento combat_damage a partir de valores ya muestreados."""
+        return {
+            **_session_templates(session)[EventType.COMBAT_DAMAGE],
+            "event_id": self._next_event_id(),
+            "timestamp": timestamp,
+            "encounter_duration_ms": encounter_duration_ms,
+            **source.source_fields,
+            "target_entity_health_pct_before": hp_before,
+            "target_entity_health_pct_after": hp_after,
+            **ability,
+            "damage_amount": damage,
+            "is_critical_hit": is_crit,
+            "critical_multiplier": crit_mult,
+            "ingestion_timestamp": self._ingestion_now(),
+            "data_quality_flags": [],
+        }
 
     def _create_heal_event(
         self,
@@ -476,55 +1165,88 @@ class WoWEventGenerator:
         session: RaidSession,
         timestamp: datetime,
         phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+        target: Player | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de curación."""
-        healer = player
-        target = self._py_rng.choice(session.players)
-        ability = ability = self._get_ability(player, "heal")
-
-        base_heal = float(self._rng.normal(loc=9500, scale=2500))
-        healing = float(np.clip(base_heal * phase.healing_multiplier, 3000, 40000))
-
-        is_crit = bool(self._rng.binomial(n=1, p=0.12))
-        crit_mult = float(self._rng.uniform(1.3, 1.9)) if is_crit else 1.0
-
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
+        return self._new_event(
+            **self._heal_row(
+                player, session, timestamp, phase, encounter_duration_ms, target
+            )
         )
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.HEAL,
-            timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
-            encounter_duration_ms=encounter_duration_ms,
-            source_player_id=healer.player_id,
-            source_player_name=healer.name,
-            source_player_role=PlayerRole(player.role),
-            source_player_class=PlayerClass(player.player_class),
-            source_player_level=healer.level,
-            target_entity_id=target.player_id,
-            target_entity_name=target.name,
-            target_entity_type=EntityType.PLAYER,
-            target_entity_health_pct_before=float(self._rng.uniform(20, 85)),
-            target_entity_health_pct_after=float(self._rng.uniform(50, 100)),
-            ability_id=ability["ability_id"],
-            ability_name=ability["ability_name"],
-            ability_school=ability["ability_school"],
-            damage_amount=None,
-            healing_amount=healing,
-            is_critical_hit=is_crit,
-            critical_multiplier=crit_mult,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
-            data_quality_flags=[],
+    def _heal_row(
+        self,
+        player: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+        target: Player | None = None,
+    ) -> dict:
+        """Campos de un evento de curación (incluye muestreo)."""
+        if target is None:
+            target = self._pick_player(session)
+        ability = self._get_ability(player, "heal")
+
+        draw = self._draws.draw
+        healing = self._draw_amount("heal", phase.healing_multiplier)
+
+        crit_mult = draw("heal_crit_mult")
+        is_crit = crit_mult > 1.0
+
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
+
+        fields = self._heal_fields(
+            player,
+            target,
+            session,
+            timestamp,
+            encounter_duration_ms,
+            ability,
+            healing,
+            is_crit,
+            crit_mult,
+            draw("heal_hp_before"),
+            draw("heal_hp_after"),
         )
+        fields["server_latency_ms"] = self._draws.draw("lat_server")
+        fields["client_latency_ms"] = self._draws.draw("lat_client")
+        return fields
+
+    def _heal_fields(
+        self,
+        healer: Player,
+        target: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        encounter_duration_ms: int,
+        ability: dict,
+        healing: float,
+        is_crit: bool,
+        crit_mult: float,
+        hp_before: float,
+        hp_after: float,
+    ) -> dict:
+        """Campos de un evento heal a partir de valores ya muestreados."""
+        return {
+            **_session_templates(session)[EventType.HEAL],
+            "event_id": self._next_event_id(),
+            "timestamp": timestamp,
+            "encounter_duration_ms": encounter_duration_ms,
+            **healer.source_fields,
+            "target_entity_id": target.player_id,
+            "target_entity_name": target.name,
+            "target_entity_health_pct_before": hp_before,
+            "target_entity_health_pct_after": hp_after,
+            **ability,
+            "healing_amount": healing,
+            "is_critical_hit": is_crit,
+            "critical_multiplier": crit_mult,
+            "ingestion_timestamp": self._ingestion_now(),
+            "data_quality_flags": [],
+        }
 
     def _create_spell_cast_event(
         self,
@@ -532,92 +1254,88 @@ class WoWEventGenerator:
         session: RaidSession,
         timestamp: datetime,
         phase: BossPhase,
+        encounter_duration_ms: int | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de spell_cast."""
+        return self._new_event(
+            **self._spell_cast_row(
+                player, session, timestamp, phase, encounter_duration_ms
+            )
+        )
+
+    def _spell_cast_row(
+        self,
+        player: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+    ) -> dict:
+        """Campos de un evento de spell_cast."""
         caster = player
         ability_type = "heal" if player.role == "healer" else "damage"
         ability = self._get_ability(player, ability_type)
 
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
-        )
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.SPELL_CAST,
+        return dict(
+            **_session_templates(session)[EventType.SPELL_CAST],
+            event_id=self._next_event_id(),
             timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
             encounter_duration_ms=encounter_duration_ms,
-            source_player_id=caster.player_id,
-            source_player_name=caster.name,
-            source_player_role=PlayerRole(player.role),
-            source_player_class=PlayerClass(player.player_class),
-            source_player_level=caster.level,
-            target_entity_id=session.boss_id,
-            target_entity_name=session.boss_name,
-            target_entity_type=EntityType.BOSS,
-            ability_id=ability["ability_id"],
-            ability_name=ability["ability_name"],
-            ability_school=ability["ability_school"],
-            damage_amount=None,
-            healing_amount=None,
-            is_critical_hit=False,
-            critical_multiplier=1.0,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
+            **caster.source_fields,
+            **ability,
+            server_latency_ms=self._draws.draw("lat_server"),
+            client_latency_ms=self._draws.draw("lat_client"),
+            ingestion_timestamp=self._ingestion_now(),
             data_quality_flags=[],
         )
 
     def _create_mana_regen_event(
-        self, player: Player, session: RaidSession, timestamp: datetime
+        self,
+        player: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        encounter_duration_ms: int | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de regeneración de maná."""
+        return self._new_event(
+            **self._mana_regen_row(player, session, timestamp, encounter_duration_ms)
+        )
+
+    def _mana_regen_row(
+        self,
+        player: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        encounter_duration_ms: int | None = None,
+    ) -> dict:
+        """Campos de un evento de regeneración de maná."""
         caster = player
 
-        mana_before = float(self._rng.uniform(20, 80))
-        mana_regen_rate = float(self._rng.uniform(50, 150))
+        mana_before = self._draws.draw("mana_before")
+        mana_regen_rate = self._draws.draw("mana_regen_rate")
         mana_after = min(100.0, mana_before + (mana_regen_rate / 10))
 
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
-        )
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.MANA_REGENERATION,
+        return dict(
+            **_session_templates(session)[EventType.MANA_REGENERATION],
+            event_id=self._next_event_id(),
             timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
             encounter_duration_ms=encounter_duration_ms,
-            source_player_id=caster.player_id,
-            source_player_name=caster.name,
-            source_player_role=PlayerRole(player.role),
-            source_player_class=PlayerClass(player.player_class),
-            source_player_level=caster.level,
+            **caster.source_fields,
             target_entity_id=caster.player_id,
             target_entity_name=caster.name,
-            target_entity_type=EntityType.PLAYER,
-            resource_type=ResourceType(player.resource_type),
+            resource_type=_RESOURCE_TYPES[player.resource_type],
             resource_amount_before=mana_before,
             resource_amount_after=mana_after,
             resource_regeneration_rate=mana_regen_rate,
-            damage_amount=None,
-            healing_amount=None,
-            is_critical_hit=False,
-            critical_multiplier=1.0,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
+            server_latency_ms=self._draws.draw("lat_server"),
+            client_latency_ms=self._draws.draw("lat_client"),
+            ingestion_timestamp=self._ingestion_now(),
             data_quality_flags=[],
         )
 
@@ -627,50 +1345,52 @@ class WoWEventGenerator:
         session: RaidSession,
         timestamp: datetime,
         phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+        target: Player | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de muerte de jugador."""
-        if self._rng.random() > phase.death_probability:
+        return self._new_event(
+            **self._player_death_row(
+                victim, session, timestamp, phase, encounter_duration_ms, target
+            )
+        )
+
+    def _player_death_row(
+        self,
+        victim: Player,
+        session: RaidSession,
+        timestamp: datetime,
+        phase: BossPhase,
+        encounter_duration_ms: int | None = None,
+        target: Player | None = None,
+    ) -> dict:
+        """Campos de un evento de muerte (o de curación si no muere)."""
+        if self._draws.draw("death_roll") > phase.death_probability:
             healer = self._pick_player(session, role="healer")
-            return self._create_heal_event(healer, session, timestamp, phase)
+            return self._heal_row(
+                healer, session, timestamp, phase, encounter_duration_ms, target
+            )
 
-        victim = self._py_rng.choice(session.players)
-        boss_ability = self._py_rng.choice(self._boss_abilities)
+        victim = target if target is not None else self._pick_player(session)
+        boss_ability = self._boss_abilities[
+            int(self._draws.draw("ability_u") * len(self._boss_abilities))
+        ]
 
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
-        )
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.PLAYER_DEATH,
+        return dict(
+            **_session_templates(session)[EventType.PLAYER_DEATH],
+            event_id=self._next_event_id(),
             timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
             encounter_duration_ms=encounter_duration_ms,
-            source_player_id=session.boss_id,
-            source_player_name=session.boss_name,
-            source_player_role=None,
-            source_player_class=None,
-            source_player_level=None,
             target_entity_id=victim.player_id,
             target_entity_name=victim.name,
-            target_entity_type=EntityType.PLAYER,
-            target_entity_health_pct_before=float(self._rng.uniform(0, 25)),
-            target_entity_health_pct_after=0.0,
-            ability_id=boss_ability["ability_id"],
-            ability_name=boss_ability["ability_name"],
-            ability_school=DamageSchool(boss_ability["ability_school"]),
-            damage_amount=None,
-            healing_amount=None,
-            is_critical_hit=False,
-            critical_multiplier=1.0,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
+            target_entity_health_pct_before=self._draws.draw("death_hp_before"),
+            **boss_ability,
+            server_latency_ms=self._draws.draw("lat_server"),
+            client_latency_ms=self._draws.draw("lat_client"),
+            ingestion_timestamp=self._ingestion_now(),
             data_quality_flags=["player_death"],
         )
 
@@ -681,8 +1401,30 @@ class WoWEventGenerator:
         phase: BossPhase,
         hp_pct_before: float | None = None,
         hp_pct_after: float | None = None,
+        encounter_duration_ms: int | None = None,
     ) -> WoWRaidEvent:
         """Genera evento de transición de fase del boss."""
+        return self._new_event(
+            **self._boss_phase_row(
+                session,
+                timestamp,
+                phase,
+                hp_pct_before,
+                hp_pct_after,
+                encounter_duration_ms,
+            )
+        )
+
+    def _boss_phase_row(
+        self,
+        session: RaidSession,
+        timestamp: datetime,
+        phase: BossPhase,
+        hp_pct_before: float | None = None,
+        hp_pct_after: float | None = None,
+        encounter_duration_ms: int | None = None,
+    ) -> dict:
+        """Campos de un evento de transición de fase del boss."""
 
         hp_before = (
             hp_pct_before
@@ -695,37 +1437,18 @@ class WoWEventGenerator:
             else float(100 - phase.phase_number * 33)
         )
 
-        encounter_duration_ms = int(
-            (timestamp - session.start_time).total_seconds() * 1000
-        )
+        if encounter_duration_ms is None:
+            encounter_duration_ms = _encounter_ms(session, timestamp)
 
-        return WoWRaidEvent(
-            event_id=uuid.uuid4(),
-            event_type=EventType.BOSS_PHASE,
+        return dict(
+            **_session_templates(session)[EventType.BOSS_PHASE],
+            event_id=self._next_event_id(),
             timestamp=timestamp,
-            raid_id=session.raid_id,
-            encounter_id=f"{session.boss_id}_encounter",
             encounter_duration_ms=encounter_duration_ms,
-            source_player_id=session.boss_id,
-            source_player_name=session.boss_name,
-            source_player_role=None,
-            source_player_class=None,
-            source_player_level=None,
-            target_entity_id=session.boss_id,
-            target_entity_name=session.boss_name,
-            target_entity_type=EntityType.BOSS,
             target_entity_health_pct_before=hp_before,
             target_entity_health_pct_after=hp_after,
-            damage_amount=None,
-            healing_amount=None,
-            is_critical_hit=False,
-            critical_multiplier=1.0,
-            is_resisted=False,
-            is_blocked=False,
-            is_absorbed=False,
-            server_latency_ms=self._latency_ms(45, 10),
-            client_latency_ms=self._latency_ms(50, 15),
-            ingestion_timestamp=datetime.now(timezone.utc),
-            source_system="wow-raid-addon-v2.0",
-            data_quality_flags=[f"boss_phase_{phase.phase_number}"],
+            server_latency_ms=self._draws.draw("lat_server"),
+            client_latency_ms=self._draws.draw("lat_client"),
+            ingestion_timestamp=self._ingestion_now(),
+            data_quality_flags=[phase.quality_flag],
         )
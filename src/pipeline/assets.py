@@ -10,7 +10,7 @@ def silver_events(context: AssetExecutionContext) -> MaterializeResult:
 
     # 1. Importa las dos clases que ya tienes en src/etl/
     #    (las mismas que usa run_bronze_to_silver.py)
-    from src.storage.minio_client import MinIOStorageClient
+    from src.storage.minio_client import BRONZE_EXTENSIONS, MinIOStorageClient
     from src.etl.bronze_to_silver import BronzeToSilverETL
 
     # 2. Instancia los clientes (igual que en main())
@@ -25,7 +25,7 @@ def silver_events(context: AssetExecutionContext) -> MaterializeResult:
     bronze_files = [
         obj["Key"]
         for obj in response.get("Contents", [])
-        if obj["Key"].endswith(".json")
+        if obj["Key"].endswith(BRONZE_EXTENSIONS)
     ]
     context.log.info(f"Encontrados {len(bronze_files)} archivos")
 
@@ -0,0 +1,56 @@
+# src/schemas/__init__.py
+"""
+Schemas Pydantic del pipeline, con import diferido.
+
+Construir los core-schemas de Pydantic es caro, así que los modelos se
+importan solo al pedirlos (PEP 562): `from src.schemas import WoWRaidEvent`
+carga eventos_schema, y los modelos Dim*/Fact*/Player* cargan gold_schemas.
+Un proceso que no usa un grupo de modelos no paga su construcción.
+"""
+
+from importlib import import_module
+
+# Formato de raid_id (raid001, raid002, ...), compartido por los schemas de
+# eventos y Gold sin que uno tenga que importar al otro
+RAID_ID_PATTERN = r"^raid\d{3}$"
+
+_LAZY_MODULES = {
+    "eventos_schema": (
+        "BATCH_ADAPTER",
+        "DamageSchool",
+        "EntityType",
+        "EventBatch",
+        "EventType",
+        "PlayerClass",
+        "PlayerRole",
+        "ResourceType",
+        "WoWRaidEvent",
+    ),
+    "gold_schemas": (
+        "DimPlayerSchema",
+        "DimRaidSchema",
+        "FactPlayerRaidStatsSchema",
+        "FactRaidSummarySchema",
+        "PlayerImpactIndexSchema",
+        "PlayerStyle",
+        "RaidOutcome",
+    ),
+}
+_LAZY_ATTRS = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+__all__ = ["RAID_ID_PATTERN", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # siguientes accesos sin pasar por __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -7,11 +7,24 @@ Fecha: Enero 2026
 Autor: Pipeline WoW Team
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from datetime import datetime, timezone
 from enum import Enum
 from uuid import UUID, uuid4
 
+# Formato de raid_id, compartido con gold_schemas. Se deja como pattern de
+# Field: pydantic-core lo valida con su regex en Rust, más rápido que
+# cualquier validador Python equivalente.
+from src.schemas import RAID_ID_PATTERN
+
+
 # ============================================================================
 # ENUMERACIONES (Valores Fijos)
 # ============================================================================
@@ -111,7 +124,7 @@ class WoWRaidEvent(BaseModel):
 
     # ====== CONTEXTO (Raid/Encounter) ======
     raid_id: str = Field(
-        pattern=r"^raid\d{3}$",  # Regex: raid001, raid002, ...
+        pattern=RAID_ID_PATTERN,  # Regex: raid001, raid002, ...
         description="Raid identifier (e.g., raid001)",
     )
 
@@ -243,71 +256,74 @@ class WoWRaidEvent(BaseModel):
     model_config = {
         "extra": "forbid",  # No permitir campos extra (Schema estricto)
         "str_strip_whitespace": True,  # Trim automático de strings
-        "validate_default": True,  # Validar valores default también
+        # Sin validate_default: los defaults son válidos por construcción
+        # (test_defaults_are_valid) y no se revalidan en cada evento
+        "frozen": True,  # Inmutable tras validar (Schema-on-Write)
     }
 
+    # ====== CONSTRUCCIÓN SIN VALIDACIÓN ======
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "WoWRaidEvent":
+        """
+        Construye el evento SIN validar (model_construct).
+
+        Solo para datos internos que ya cumplen el schema (filas del generador,
+        Bronze ya validado en escritura). La entrada HTTP no confiable debe
+        pasar SIEMPRE por la validación completa (BATCH_ADAPTER).
+        """
+        return cls.model_construct(**data)
+
     # ====== VALIDADORES PERSONALIZADOS ======
 
     @field_validator("timestamp")
     @classmethod
-    def timestamp_not_future(cls, v: datetime) -> datetime:
+    def timestamp_not_future(cls, v: datetime, info: ValidationInfo) -> datetime:
         """
         Validador: El timestamp NO puede estar en el futuro.
 
         Analogía: Una marca temporal de fabricación no puede ser posterior a HOY.
+
+        En validación por lotes el llamador fija "now" una sola vez en el
+        contexto (context={"now": ...}); si no viene, se lee el reloj.
         """
-        now = datetime.now(timezone.utc)
+        now = (info.context or {}).get("now") or datetime.now(timezone.utc)
         if v > now:
             raise ValueError(
                 f"timestamp cannot be in the future (got {v}, now is {now})"
             )
         return v
 
-    @field_validator("damage_amount")
-    @classmethod
-    def validate_damage_for_damage_events(cls, v: float | None, info) -> float | None:
+    @model_validator(mode="after")
+    def validate_event_type_requirements(self) -> "WoWRaidEvent":
         """
-        Validador: Si event_type es COMBAT_DAMAGE, damage_amount es OBLIGATORIO y > 0.
+        Validador: campos obligatorios según event_type.
+
+        - COMBAT_DAMAGE: damage_amount es OBLIGATORIO y > 0.
+        - HEAL: healing_amount es OBLIGATORIO y > 0.
+        - MANA_REGENERATION: resource_type es OBLIGATORIO.
 
-        Lógica condicional: Accede al event_type usando info.data.
+        Un único validador sobre el modelo ya construido: una sola llamada a
+        Python por evento y sin materializar info.data por campo. event_type
+        ya es un miembro del enum (singleton), así que basta con `is`.
         """
-        event_type = info.data.get("event_type")
-        if event_type == EventType.COMBAT_DAMAGE:
-            if v is None or v <= 0:
+        event_type = self.event_type
+        if event_type is EventType.COMBAT_DAMAGE:
+            if self.damage_amount is None or self.damage_amount <= 0:
                 raise ValueError(
                     "damage_amount is required and must be > 0 for combat_damage events"
                 )
-        return v
-
-    @field_validator("healing_amount")
-    @classmethod
-    def validate_healing_for_heal_events(cls, v: float | None, info) -> float | None:
-        """
-        Validador: Si event_type es HEAL, healing_amount es OBLIGATORIO y > 0.
-        """
-        event_type = info.data.get("event_type")
-        if event_type == EventType.HEAL:
-            if v is None or v <= 0:
+        elif event_type is EventType.HEAL:
+            if self.healing_amount is None or self.healing_amount <= 0:
                 raise ValueError(
                     "healing_amount is required and must be > 0 for heal events"
                 )
-        return v
-
-    @field_validator("resource_type")
-    @classmethod
-    def validate_resource_for_mana_events(
-        cls, v: ResourceType | None, info
-    ) -> ResourceType | None:
-        """
-        Validador: Si event_type es MANA_REGENERATION, resource_type es OBLIGATORIO.
-        """
-        event_type = info.data.get("event_type")
-        if event_type == EventType.MANA_REGENERATION:
-            if v is None:
+        elif event_type is EventType.MANA_REGENERATION:
+            if self.resource_type is None:
                 raise ValueError(
                     "resource_type is required for mana_regeneration events"
                 )
-        return v
+        return self
 
 
 # ============================================================================
@@ -338,23 +354,48 @@ class EventBatch(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+# Adaptador para validar un lote completo en una sola llamada a pydantic-core:
+# el bucle sobre los eventos se ejecuta en Rust, sin un __init__ por evento.
+BATCH_ADAPTER = TypeAdapter(list[WoWRaidEvent])
+
+
 # ============================================================================
 # UTILIDADES
 # ============================================================================
 
 
+# JSON Schema pregenerado que se distribuye con el paquete. Se regenera con
+# write_packaged_json_schema() (o src/schemas/export_schema.py) al cambiar el
+# modelo; test_packaged_json_schema_is_current detecta si queda desfasado.
+PACKAGED_JSON_SCHEMA = "_eventos_schema.json"
+
+
+def write_packaged_json_schema() -> None:
+    """Regenera el JSON Schema pregenerado junto a este módulo."""
+    import json
+    from pathlib import Path
+
+    schema = WoWRaidEvent.model_json_schema()
+    path = Path(__file__).with_name(PACKAGED_JSON_SCHEMA)
+    path.write_text(
+        json.dumps(schema, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+
 def export_json_schema(output_path: str = "eventos_schema.json") -> None:
     """
     Exporta el JSON Schema formal del modelo WoWRaidEvent.
 
+    Copia el schema pregenerado del paquete: no construye el grafo del
+    schema en cada llamada.
+
     Uso:
-        python eventos_schema.py --export-json-schema
+        python -m src.schemas.eventos_schema --export-json-schema
     """
-    import json
+    import shutil
+    from pathlib import Path
 
-    schema = WoWRaidEvent.model_json_schema()
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+    shutil.copyfile(Path(__file__).with_name(PACKAGED_JSON_SCHEMA), output_path)
     print(f"✅ JSON Schema exportado a: {output_path}")
 
 
@@ -364,4 +405,4 @@ if __name__ == "__main__":
     if "--export-json-schema" in sys.argv:
         export_json_schema()
     else:
-        print("Uso: python eventos_schema.py --export-json-schema")
+        print("Uso: python -m src.schemas.eventos_schema --export-json-schema")
@@ -10,7 +10,7 @@ from pathlib import Path
 import json
 from datetime import datetime
 
-from src.schemas.eventos_schema import WoWRaidEvent
+from src.schemas.eventos_schema import WoWRaidEvent, write_packaged_json_schema
 
 
 def main():
@@ -54,6 +54,9 @@ def main():
         json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8"
     )
 
+    # Refrescar también la copia pregenerada que se distribuye con el paquete
+    write_packaged_json_schema()
+
     # File stats
     file_size_kb = out_path.stat().st_size / 1024
 
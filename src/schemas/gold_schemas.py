@@ -21,8 +21,19 @@ Versión: 1.0 — Fase 4
 
 from datetime import date
 from enum import Enum
+from functools import cached_property
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from src.schemas import RAID_ID_PATTERN
 
 
 # ============================================================================
@@ -66,6 +77,17 @@ class PlayerStyle(str, Enum):
     UNKNOWN = "unknown"  # Sin clasificar (default inicial)
 
 
+# Valores admitidos como Literal: pydantic-core los comprueba en Rust, sin
+# validador Python por fila. Los roles llegan ya en minúsculas desde Silver
+# (GoldLayerETL.run_for_partition normaliza la columna una sola vez).
+PlayerRoleLiteral = Literal["tank", "healer", "dps", "unknown"]
+DifficultyLiteral = Literal["Normal", "Heroic", "Mythic"]
+# difficulty=None (sin dato de Warcraft Logs) se guarda como "Normal"
+Difficulty = Annotated[
+    DifficultyLiteral, BeforeValidator(lambda v: "Normal" if v is None else v)
+]
+
+
 # ============================================================================
 # DIMENSIONES
 # ============================================================================
@@ -99,9 +121,8 @@ class DimPlayerSchema(BaseModel):
         description="Especialización del personaje (fury, frost, restoration, etc.)",
     )
     """
-    player_role: str = Field(
-        min_length=1,
-        description="Rol principal en raid: tank | healer | dps",
+    player_role: PlayerRoleLiteral = Field(
+        description="Rol principal en raid: tank | healer | dps | unknown",
     )
     first_seen_date: date = Field(
         description="Fecha de la primera raid registrada para este jugador",
@@ -114,15 +135,7 @@ class DimPlayerSchema(BaseModel):
         description="Número total de raids en las que ha participado (acumulado histórico)",
     )
 
-    @field_validator("player_role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
-        allowed = {"tank", "healer", "dps", "unknown"}
-        if v.lower() not in allowed:
-            raise ValueError(f"player_role debe ser uno de {allowed}, recibido: '{v}'")
-        return v.lower()
-
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     """
     @field_validator("player_spec")
@@ -142,7 +155,7 @@ class DimRaidSchema(BaseModel):
     """
 
     raid_id: str = Field(
-        pattern=r"^raid\d{3}$",
+        pattern=RAID_ID_PATTERN,
         description="Identificador de la raid (ej. raid005). FK a fact tables.",
     )
     event_date: date = Field(
@@ -152,9 +165,9 @@ class DimRaidSchema(BaseModel):
         default="Unknown Boss",
         description="Nombre del boss principal del encuentro",
     )
-    difficulty: str | None = Field(
+    difficulty: Difficulty = Field(
         default="Normal",
-        description="Nivel de dificultad: Normal | Heroic | Mythic",
+        description="Nivel de dificultad: Normal | Heroic | Mythic (None -> Normal)",
     )
     raid_size: int = Field(
         ge=1,
@@ -167,17 +180,7 @@ class DimRaidSchema(BaseModel):
         description="Duración objetivo del encuentro en ms (6 min por defecto)",
     )
 
-    @field_validator("difficulty")
-    @classmethod
-    def validate_difficulty(cls, v: str | None) -> str | None:
-        if v is None:
-            return "Normal"
-        allowed = {"Normal", "Heroic", "Mythic"}
-        if v not in allowed:
-            raise ValueError(f"difficulty debe ser uno de {allowed}, recibido: '{v}'")
-        return v
-
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 # ============================================================================
@@ -200,7 +203,7 @@ class FactRaidSummarySchema(BaseModel):
     """
 
     raid_id: str = Field(
-        pattern=r"^raid\d{3}$",
+        pattern=RAID_ID_PATTERN,
         description="FK a dim_raid.raid_id",
     )
     event_date: date = Field(
@@ -258,7 +261,7 @@ class FactRaidSummarySchema(BaseModel):
             )
         return self
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class FactPlayerRaidStatsSchema(BaseModel):
@@ -274,14 +277,14 @@ class FactPlayerRaidStatsSchema(BaseModel):
     deliberadamente para facilitar queries y dashboards sin JOINs.
     """
 
-    raid_id: str = Field(pattern=r"^raid\d{3}$", description="FK a dim_raid.raid_id")
+    raid_id: str = Field(pattern=RAID_ID_PATTERN, description="FK a dim_raid.raid_id")
     event_date: date = Field(description="Fecha del encuentro")
 
     # --- Identidad del jugador (denormalizado) ---
     player_id: str = Field(min_length=1, description="FK a dim_player.player_id")
     player_name: str = Field(min_length=1, max_length=12)
     player_class: str = Field(min_length=1)
-    player_role: str = Field(min_length=1)
+    player_role: PlayerRoleLiteral
 
     # --- Volúmenes de combate ---
     damage_total: float = Field(ge=0.0, description="Daño total infligido")
@@ -315,16 +318,6 @@ class FactPlayerRaidStatsSchema(BaseModel):
         description="Proporción de la curación total aportada por este jugador",
     )
 
-    @field_validator("player_role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
-        allowed = {"tank", "healer", "dps", "unknown"}
-        if v.lower() not in allowed:
-            raise ValueError(
-                f"player_role debe ser tank | healer | dps, recibido: '{v}'"
-            )
-        return v.lower()
-
     @field_validator("crit_rate")
     @classmethod
     def validate_crit_rate_coherence(cls, v: float, info) -> float:
@@ -333,7 +326,7 @@ class FactPlayerRaidStatsSchema(BaseModel):
             raise ValueError(f"crit_rate no puede superar 1.0, recibido: {v}")
         return round(v, 6)  # Redondear a 6 decimales para limpieza
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 # ============================================================================
@@ -350,7 +343,11 @@ class PlayerImpactIndexSchema(BaseModel):
     Granularidad: 1 fila por (raid_id, player_id).
     Pregunta de negocio: ¿Quién es el MVP de la raid?
 
-    Fórmula propuesta del impact_score (0–100):
+    impact_score es un computed_field: se deriva de las features de entrada
+    (damage_share, healing_share, crit_rate, player_deaths), que son la
+    fuente de verdad, y se calcula una vez por instancia.
+
+    Fórmula del impact_score (0–100):
         impact_score = (
             0.35 * (damage_share * 100)
           + 0.35 * (healing_share * 100)
@@ -369,16 +366,17 @@ class PlayerImpactIndexSchema(BaseModel):
     sobre features de fact_player_raid_stats en Fase C.
     """
 
-    raid_id: str = Field(pattern=r"^raid\d{3}$", description="FK a dim_raid.raid_id")
+    raid_id: str = Field(pattern=RAID_ID_PATTERN, description="FK a dim_raid.raid_id")
     event_date: date = Field(description="Fecha del encuentro")
     player_id: str = Field(min_length=1, description="FK a dim_player.player_id")
     player_name: str = Field(min_length=1, max_length=12)
 
-    impact_score: float = Field(
-        ge=0.0,
-        le=100.0,
-        description="Índice de impacto normalizado (0–100). Mayor = más crítico.",
-    )
+    # --- Features de entrada (mismos rangos que fact_player_raid_stats) ---
+    damage_share: float = Field(ge=0.0, le=1.0)
+    healing_share: float = Field(ge=0.0, le=1.0)
+    crit_rate: float = Field(ge=0.0, le=1.0)
+    player_deaths: int = Field(ge=0)
+
     impact_rank: int = Field(
         ge=1,
         description="Ranking del jugador dentro de la raid (1 = MVP)",
@@ -388,4 +386,20 @@ class PlayerImpactIndexSchema(BaseModel):
         description="Estilo de juego detectado por clustering",
     )
 
-    model_config = {"extra": "forbid"}
+    # Patrón de la doc de Pydantic para computed_field + cached_property; mypy
+    # >= 1.11 lo reporta como prop-decorator, subcódigo de misc
+    @computed_field(  # type: ignore[misc]
+        description="Índice de impacto normalizado (0–100). Mayor = más crítico."
+    )
+    @cached_property
+    def impact_score(self) -> float:
+        """Fórmula del docstring de la clase, clampeada a [0, 100]."""
+        score = (
+            0.35 * (self.damage_share * 100)
+            + 0.35 * (self.healing_share * 100)
+            + 0.15 * (self.crit_rate * 100)
+            - 0.10 * (self.player_deaths * 10)
+        )
+        return max(0.0, min(100.0, score))
+
+    model_config = {"extra": "forbid", "frozen": True}
@@ -1,9 +1,173 @@
 import os
+import io
+import gzip
 import json
+import base64
+import hashlib
+import logging
+import math
+from datetime import datetime, timezone
+from functools import cache, lru_cache
 import boto3
+import numpy as np
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # orjson es opcional: fallback a json de la stdlib
+    _HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+_MiB = 1024 * 1024
+
+# A partir de este tamaño el batch se sube en multipart (partes subidas en
+# paralelo por varios hilos) en lugar de un único put_object
+MULTIPART_THRESHOLD_BYTES = 16 * _MiB
+
+# Máximo de partes subidas a la vez por batch
+MAX_UPLOAD_CONCURRENCY = 16
+
+
+def _choose_part_size(total_bytes: int) -> int:
+    """
+    Tamaño de parte multipart según el tamaño del batch.
+
+    16 MiB hasta 200 MiB, 32 MiB hasta 1 GiB y 50 MiB por encima: partes
+    grandes amortizan el coste por request sin dejar pocas partes en vuelo.
+    """
+    if total_bytes < 200 * _MiB:
+        return 16 * _MiB
+    if total_bytes <= 1024 * _MiB:
+        return 32 * _MiB
+    return 50 * _MiB
+
+
+@cache
+def _transfer_config(part_size: int, max_concurrency: int) -> TransferConfig:
+    """TransferConfig por (parte, concurrencia); pocas combinaciones posibles."""
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize=part_size,
+        max_concurrency=max_concurrency,
+        use_threads=True,
+    )
+
+
+# Intentos totales por request S3 (incluido el primero). Los jobs batch/ETL
+# y las subidas en segundo plano pueden esperar a que MinIO se recupere; el
+# path síncrono de la API (POST /events) responde al cliente, así que usa un
+# presupuesto corto y falla rápido si MinIO no está disponible
+BATCH_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", 10))
+REQUEST_MAX_ATTEMPTS = int(os.getenv("S3_REQUEST_MAX_ATTEMPTS", 3))
+
+
+@cache
+def _s3_config(max_attempts: int) -> Config:
+    """
+    Pool de conexiones amplio y keep-alive: un único cliente sirve a todos los
+    hilos del proceso (los clientes boto3 son thread-safe). Reintentos en modo
+    "adaptive": backoff con jitter + token bucket del lado cliente, así los
+    throttling/5xx transitorios de MinIO se absorben aquí y no en cada caller.
+    """
+    return Config(
+        max_pool_connections=64,
+        retries={"mode": "adaptive", "total_max_attempts": max_attempts},
+        connect_timeout=2,
+        read_timeout=30,
+        tcp_keepalive=True,
+    )
+
+
+@cache
+def _shared_s3_client(
+    endpoint_url: str, access_key: str, secret_key: str, max_attempts: int
+):
+    """Cliente S3 compartido por proceso para cada endpoint/credenciales/reintentos."""
+    return boto3.session.Session().client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name="us-east-1",  # MinIO ignora esto, pero boto3 lo pide
+        config=_s3_config(max_attempts),
+    )
+
+
+# Extensiones de batch que pueden vivir en Bronze (S3_BRONZE_FORMAT, y
+# .ndjson.gz para varios batches agrupados con save_batches)
+BRONZE_EXTENSIONS = (".json", ".parquet", ".ndjson.gz")
+
+# Cabecera mágica de gzip: identifica los JSON comprimidos con
+# S3_BRONZE_COMPRESSION=gzip sin cambiar la key del batch
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def decode_bronze_body(raw: bytes) -> bytes:
+    """Devuelve el JSON de un batch Bronze, descomprimiendo si viene en gzip."""
+    if raw[:2] == _GZIP_MAGIC:
+        return gzip.decompress(raw)
+    return raw
+
+
+@lru_cache(maxsize=4096)
+def _raid_key_prefix(raidid: str) -> str:
+    """Prefijo Bronze de una raid, formateado una vez por raid_id."""
+    return f"wow_raid_events/v1/raidid={raidid}/"
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback de la stdlib alineado con orjson (ISO 8601, números numpy)."""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    """
+    Serializa a JSON directamente a bytes (orjson si está disponible).
+
+    orjson serializa datetime, UUID, enums y numpy en C; default=str es solo
+    una red de seguridad para tipos que no conoce. Los datetime naive se
+    tratan como UTC, igual que en el resto del pipeline.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def _parquet_bytes(batch_data: dict[str, Any]) -> bytes:
+    """
+    Serializa los eventos del batch a Parquet (zstd + diccionario).
+
+    Los eventos llegan ya como dicts JSON-safe (model_dump(mode="json")), así
+    que las columnas tienen los mismos tipos que al leer el JSON equivalente.
+    El resto del envelope (batch_id, ingest_timestamp, event_count) viaja
+    como metadata del schema Parquet.
+    """
+    # Import diferido: pyarrow solo hace falta si Bronze se escribe en Parquet
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pylist(batch_data["events"])
+    envelope = {k: str(v) for k, v in batch_data.items() if k != "events"}
+    table = table.replace_schema_metadata(envelope)
+
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="zstd", use_dictionary=True)
+    return buffer.getvalue()
+
 
 class MinIOStorageClient:
     """
@@ -11,63 +175,186 @@ class MinIOStorageClient:
     Maneja lectura/escritura y cálculo de rutas estándar.
     """
 
-    def __init__(self):
+    def __init__(self, max_attempts: int = BATCH_MAX_ATTEMPTS):
+        """
+        max_attempts: intentos totales por request S3. Por defecto el
+        presupuesto largo de batch/ETL; los callers que responden a un
+        cliente HTTP pasan REQUEST_MAX_ATTEMPTS.
+        """
         # Carga configuración desde variables de entorno (12-factor app)
         # Usa 'localhost' por defecto para desarrollo local
         self.endpoint_url = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
         self.access_key = os.getenv("S3_ACCESS_KEY", "minio")
         self.secret_key = os.getenv("S3_SECRET_KEY", "minio123")
         self.bucket = os.getenv("S3_BUCKET_BRONZE", "bronze")
+        # Formato de los batches en Bronze: "json" (por defecto) o "parquet"
+        self.bronze_format = os.getenv("S3_BRONZE_FORMAT", "json")
+        # Compresión del JSON de Bronze: "none" (por defecto) o "gzip"
+        self.bronze_compression = os.getenv("S3_BRONZE_COMPRESSION", "none")
 
-        # Cliente boto3 puro (bajo nivel)
-        self.s3 = boto3.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name="us-east-1",  # MinIO ignora esto, pero boto3 lo pide
+        # Cliente boto3 puro (bajo nivel), compartido entre instancias: las
+        # conexiones HTTP del pool se reutilizan en lugar de abrir una por
+        # cada MinIOStorageClient efímero
+        self.s3 = _shared_s3_client(
+            self.endpoint_url, self.access_key, self.secret_key, max_attempts
         )
 
     def calculate_object_key(
-        self, raidid: str, ingest_timestamp: str, batch_id: str
+        self,
+        raidid: str,
+        ingest_timestamp: str,
+        batch_id: str,
+        extension: str = "json",
     ) -> str:
         """
         Calcula la ruta determinista donde vivirá el archivo en Bronze.
-        Pattern: wow_raid_events/v1/raidid=<id>/ingest_date=<YYYY-MM-DD>/batch_<uuid>.json
+        Pattern: wow_raid_events/v1/raidid=<id>/ingest_date=<YYYY-MM-DD>/batch_<uuid>.<ext>
         """
-        # Extraer fecha YYYY-MM-DD del timestamp ISO
-        ingest_date = ingest_timestamp[:10]
-        return f"wow_raid_events/v1/raidid={raidid}/ingest_date={ingest_date}/batch_{batch_id}.json"
+        # Fecha YYYY-MM-DD: prefijo del timestamp ISO (o la fecha tal cual)
+        return (
+            f"{_raid_key_prefix(raidid)}ingest_date={ingest_timestamp[:10]}"
+            f"/batch_{batch_id}.{extension}"
+        )
 
     def save_batch(self, raidid: str, batch_data: dict[str, Any]) -> dict[str, str]:
         """
         Persiste un batch validado en Bronze.
+
+        Con S3_BRONZE_FORMAT=parquet delega en save_batch_parquet. Con
+        S3_BRONZE_COMPRESSION=gzip el JSON se sube comprimido
+        (ContentEncoding: gzip) con la misma key.
         """
-        batch_id = batch_data["batch_id"]
-        ingest_timestamp = batch_data["ingest_timestamp"]
+        if self.bronze_format == "parquet":
+            return self.save_batch_parquet(raidid, batch_data)
 
-        # 1. Calcular dónde va (Key)
-        key = self.calculate_object_key(raidid, ingest_timestamp, batch_id)
+        # 1. Serializar a JSON (bytes, sin str intermedio con orjson)
+        body_bytes = _dumps_bytes(batch_data)
+        extra_args: dict[str, Any] = {"ContentType": "application/json"}
+        if self.bronze_compression == "gzip":
+            # El JSON repite nombres de campo y enums en cada evento y
+            # comprime bien. mtime=0: mismo batch -> mismos bytes (y MD5)
+            body_bytes = gzip.compress(body_bytes, compresslevel=6, mtime=0)
+            extra_args["ContentEncoding"] = "gzip"
 
-        # 2. Serializar a JSON (bytes)
-        body_bytes = json.dumps(batch_data, default=str).encode("utf-8")
+        # 2. Calcular dónde va (Key) y subir
+        key = self.calculate_object_key(
+            raidid, batch_data["ingest_timestamp"], batch_data["batch_id"]
+        )
+        return self._upload_bronze(raidid, key, body_bytes, extra_args)
+
+    def save_batch_parquet(
+        self, raidid: str, batch_data: dict[str, Any]
+    ) -> dict[str, str]:
+        """
+        Persiste un batch en Bronze como Parquet columnar (batch_<uuid>.parquet).
+
+        Los eventos van en columnas (zstd + diccionario) y el resto del
+        envelope en los metadatos del schema; la lectura downstream solo
+        toca las columnas que necesita.
+        """
+        key = self.calculate_object_key(
+            raidid,
+            batch_data["ingest_timestamp"],
+            batch_data["batch_id"],
+            extension="parquet",
+        )
+        return self._upload_bronze(
+            raidid,
+            key,
+            _parquet_bytes(batch_data),
+            {"ContentType": "application/vnd.apache.parquet"},
+        )
+
+    def save_batches(
+        self, raidid: str, batches: list[dict[str, Any]]
+    ) -> dict[str, str]:
+        """
+        Persiste varios batches de una raid en un único objeto Bronze.
+
+        Cada batch (envelope completo) ocupa una línea de un NDJSON
+        comprimido con gzip: un solo PUT en lugar de uno por batch, y mejor
+        ratio de compresión al haber más redundancia en el payload.
+        Pattern: .../ingest_date=<fecha del primero>/batches_<uuid del primero>_<n>.ndjson.gz
+        """
+        if not batches:
+            raise ValueError("save_batches necesita al menos un batch")
+
+        first = batches[0]
+        key = (
+            f"{_raid_key_prefix(raidid)}ingest_date={first['ingest_timestamp'][:10]}"
+            f"/batches_{first['batch_id']}_{len(batches)}.ndjson.gz"
+        )
+        body_bytes = gzip.compress(
+            b"\n".join(_dumps_bytes(batch) for batch in batches),
+            compresslevel=6,
+            mtime=0,
+        )
+        return self._upload_bronze(
+            raidid,
+            key,
+            body_bytes,
+            {"ContentType": "application/x-ndjson", "ContentEncoding": "gzip"},
+        )
+
+    def _upload_bronze(
+        self,
+        raidid: str,
+        key: str,
+        body_bytes: bytes,
+        extra_args: dict[str, Any],
+    ) -> dict[str, str]:
+        """Sube un batch ya serializado a Bronze (PUT único o multipart)."""
+        metadata = {
+            "source": "wow-telemetry-pipeline",
+            "layer": "bronze",
+            "raidid": raidid,
+        }
 
         try:
-            self.s3.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=body_bytes,
-                ContentType="application/json",
-                Metadata={
-                    "source": "wow-telemetry-pipeline",
-                    "layer": "bronze",
-                    "raidid": raidid,
-                },
-            )
+            total_bytes = len(body_bytes)
+            if total_bytes > MULTIPART_THRESHOLD_BYTES:
+                # Batches grandes: multipart concurrente desde un buffer en
+                # memoria (varias conexiones en paralelo, no un solo socket),
+                # sin más hilos que partes
+                part_size = _choose_part_size(total_bytes)
+                concurrency = min(
+                    MAX_UPLOAD_CONCURRENCY, math.ceil(total_bytes / part_size)
+                )
+                logger.debug(
+                    "Multipart %s: %d bytes, partes de %d MiB, %d hilos",
+                    key,
+                    total_bytes,
+                    part_size // _MiB,
+                    concurrency,
+                )
+                self.s3.upload_fileobj(
+                    io.BytesIO(body_bytes),
+                    self.bucket,
+                    key,
+                    ExtraArgs={**extra_args, "Metadata": metadata},
+                    Config=_transfer_config(part_size, concurrency),
+                )
+            else:
+                # Longitud y MD5 explícitos: PUT único con Content-Length y
+                # verificación de integridad en MinIO
+                content_md5 = base64.b64encode(
+                    hashlib.md5(body_bytes, usedforsecurity=False).digest()
+                ).decode("ascii")
+                self.s3.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=body_bytes,
+                    ContentLength=total_bytes,
+                    ContentMD5=content_md5,
+                    Metadata=metadata,
+                    **extra_args,
+                )
             return {"status": "success", "s3_path": f"s3://{self.bucket}/{key}"}
 
-        except ClientError as err:
-            # Aquí podrías loguear el error real
+        except (ClientError, S3UploadFailedError) as err:
+            # Llega aquí tras agotar los reintentos de botocore (o por un
+            # error no reintentable: bucket inexistente, credenciales...)
+            logger.error("Error escribiendo %s en Bronze: %s", key, err)
             raise ConnectionError(f"Error escribiendo en MinIO: {err}") from err
 
     # --- MÉTODOS AÑADIDOS PARA FASE 3 (Silver ETL) ---
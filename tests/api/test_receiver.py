@@ -6,12 +6,16 @@ Phase: 2.1 (HTTP Receiver - Basic)
 
 import pytest
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from scripts.api import receiver
 from scripts.api.receiver import create_app
 from src.generators.raid_event_generator import WoWEventGenerator
+from src.schemas.eventos_schema import BATCH_ADAPTER
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")  # la app no guarda estado entre requests
 def client():
     """Flask test client."""
     app = create_app()
@@ -20,7 +24,7 @@ def client():
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")  # solo se serializa con json.dumps, no se muta
 def sample_events():
     generator = WoWEventGenerator(seed=42)
     session = generator.generate_raid_session(
@@ -29,7 +33,7 @@ def sample_events():
         duration_s=30,
     )
     events = generator.generate_events(session, num_events=10)
-    return [e.model_dump(mode="json") for e in events]
+    return BATCH_ADAPTER.dump_python(events, mode="json")  # un solo pase
 
 
 def test_health_check(client):
@@ -71,6 +75,8 @@ def test_post_invalid_event(client):
     data = response.get_json()
     assert data["status"] == "validation_failed"
     assert data["invalid_count"] == 1
+    # event_data devuelve el evento tal cual lo envió el cliente
+    assert data["errors"][0]["event_data"] == invalid_payload[0]
 
 
 def test_post_empty_payload(client):
@@ -91,3 +97,58 @@ def test_post_non_json(client):
     assert response.status_code == 400
     data = response.get_json()
     assert "error" in data
+
+
+@pytest.fixture
+def async_uploads(monkeypatch):
+    """Receptor en modo ASYNC_UPLOADS con un hueco de cola y SSE espiado."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    published: list[dict] = []
+    monkeypatch.setattr(receiver, "upload_pool", pool)
+    monkeypatch.setattr(receiver, "pending_uploads", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(receiver.storage_client, "save_batch", lambda *a: None)
+    monkeypatch.setattr(receiver.sse_bus, "publish", published.append)
+    yield pool, published
+    pool.shutdown(wait=True)
+
+
+def test_async_upload_queued(client, sample_events, async_uploads):
+    """ASYNC_UPLOADS: 202 y los eventos se publican en SSE una vez."""
+    _, published = async_uploads
+    response = client.post(
+        "/events", data=json.dumps(sample_events), content_type="application/json"
+    )
+
+    assert response.status_code == 202
+    assert response.get_json()["storage"] == {"status": "queued"}
+    assert len(published) == len(sample_events)
+
+
+def test_async_upload_queue_full_not_published(client, sample_events, async_uploads):
+    """Cola llena: 503 storage_busy sin publicar nada en SSE."""
+    _, published = async_uploads
+    receiver.pending_uploads.acquire()  # único hueco ocupado
+
+    response = client.post(
+        "/events", data=json.dumps(sample_events), content_type="application/json"
+    )
+
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "storage_busy"
+    assert published == []
+
+
+def test_async_upload_submit_failure_releases_slot(
+    client, sample_events, async_uploads
+):
+    """Si submit falla (pool cerrado) el hueco de la cola se devuelve."""
+    pool, published = async_uploads
+    pool.shutdown()
+
+    response = client.post(
+        "/events", data=json.dumps(sample_events), content_type="application/json"
+    )
+
+    assert response.status_code == 500
+    assert published == []
+    assert receiver.pending_uploads.acquire(blocking=False)
@@ -6,7 +6,7 @@ from src.generators.raid_event_generator import WoWEventGenerator, BossPhase
 
 @pytest.fixture(scope="module")  # ← "module": se crea UNA vez por archivo de test
 def generator():
-    return WoWEventGenerator(seed=42)
+    return WoWEventGenerator(seed=42, strict=True)
 
 
 @pytest.fixture(scope="module")  # ← depende de generator, mismo scope
@@ -14,6 +14,11 @@ def session(generator):
     return generator.generate_raid_session(raid_id="raid001", num_players=20)
 
 
+@pytest.fixture(scope="module")  # ← lookup player_id → player de la sesión
+def player_map(session):
+    return {p.player_id: p for p in session.players}
+
+
 @pytest.fixture  # ← sin scope: se recrea en cada test que la pide
 def dummy_phase():
     return BossPhase(
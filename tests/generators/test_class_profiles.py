@@ -1,6 +1,19 @@
 # tests/test_class_profiles.py
+import numpy as np
+
 from src.generators.class_profiles import SPEC_PROFILES, SPECS_BY_ROLE
 
+# Matriz (n_specs, n_event_types) de pesos, construida una vez al importar
+_SPEC_KEYS = list(SPEC_PROFILES)
+_EVENT_KEYS = list(next(iter(SPEC_PROFILES.values()))["event_weights"])
+_WEIGHT_MATRIX = np.array(
+    [
+        [profile["event_weights"][k] for k in _EVENT_KEYS]
+        for profile in SPEC_PROFILES.values()
+    ],
+    dtype=np.float64,
+)
+
 
 def test_known_role_assignments():
     """
@@ -64,11 +77,11 @@ def test_known_role_assignments():
 
 
 def test_weights_sum_to_one():
-    for (cls, spec), profile in SPEC_PROFILES.items():
-        total = sum(profile["event_weights"].values())
-        assert abs(total - 1.0) < 1e-9, (
-            f"❌ ({cls}, {spec}) suma {total:.10f}, esperado 1.0"
-        )
+    totals = _WEIGHT_MATRIX.sum(axis=1)
+    bad = np.flatnonzero(~np.isclose(totals, 1.0, rtol=0.0, atol=1e-9))
+    assert bad.size == 0, "\n".join(
+        f"❌ {_SPEC_KEYS[i]} suma {totals[i]:.10f}, esperado 1.0" for i in bad
+    )
     print(f"✅ {len(SPEC_PROFILES)} specs validadas — todos los pesos suman 1.0")
 
 
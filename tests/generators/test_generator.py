@@ -1,5 +1,17 @@
+from dataclasses import replace
+
+import pytest
+
 from src.generators.class_profiles import SPEC_PROFILES
-from src.schemas.eventos_schema import EventType
+from src.generators.raid_event_generator import WoWEventGenerator, _build_alias_table
+from src.schemas.eventos_schema import EventType, WoWRaidEvent
+
+# Catálogo de nombres por (class, spec, kind), calculado una vez al importar
+_ABILITY_NAMES = {
+    (cls, spec, kind): frozenset(a["ability_name"] for a in profile["abilities"][kind])
+    for (cls, spec), profile in SPEC_PROFILES.items()
+    for kind in ("damage", "heal")
+}
 
 
 def test_player_roles_coherent_with_spec_profiles(session):
@@ -18,10 +30,7 @@ def test_get_ability_damage_in_spec_catalog(generator, session):
     ability = generator._get_ability(dps, "damage")
 
     # Assert: la ability devuelta debe estar en el catálogo de su spec
-    valid_names = [
-        a["ability_name"]
-        for a in SPEC_PROFILES[(dps.player_class, dps.spec)]["abilities"]["damage"]
-    ]
+    valid_names = _ABILITY_NAMES[(dps.player_class, dps.spec, "damage")]
     assert ability["ability_name"] in valid_names
 
 
@@ -30,10 +39,7 @@ def test_get_ability_heal_in_spec_catalog(generator, session):
     ability = generator._get_ability(heal, "heal")
 
     # Assert: la ability devuelta debe estar en el catálogo de su spec
-    valid_names = [
-        a["ability_name"]
-        for a in SPEC_PROFILES[(heal.player_class, heal.spec)]["abilities"]["heal"]
-    ]
+    valid_names = _ABILITY_NAMES[(heal.player_class, heal.spec, "heal")]
     assert ability["ability_name"] in valid_names
 
 
@@ -61,11 +67,7 @@ def test_create_damage_event_type_and_ability(
     assert ev.event_type == EventType.COMBAT_DAMAGE
     assert ev.damage_amount is not None and ev.damage_amount > 0
 
-    valid_names = [
-        a["ability_name"]
-        for a in SPEC_PROFILES[(dps.player_class, dps.spec)]["abilities"]["damage"]
-    ]
-    assert ev.ability_name in valid_names
+    assert ev.ability_name in _ABILITY_NAMES[(dps.player_class, dps.spec, "damage")]
 
 
 def test_create_heal_event_type_and_ability(
@@ -77,11 +79,7 @@ def test_create_heal_event_type_and_ability(
     assert ev.event_type == EventType.HEAL
     assert ev.healing_amount is not None and ev.healing_amount > 0
 
-    valid_names = [
-        a["ability_name"]
-        for a in SPEC_PROFILES[(healer.player_class, healer.spec)]["abilities"]["heal"]
-    ]
-    assert ev.ability_name in valid_names
+    assert ev.ability_name in _ABILITY_NAMES[(healer.player_class, healer.spec, "heal")]
 
 
 def test_create_spell_cast_healer_uses_heal_ability(
@@ -97,10 +95,7 @@ def test_create_spell_cast_healer_uses_heal_ability(
     assert ev.event_type == EventType.SPELL_CAST
 
     # Un healer debe lanzar una heal ability, no una de daño
-    valid_heal_names = [
-        a["ability_name"]
-        for a in SPEC_PROFILES[(healer.player_class, healer.spec)]["abilities"]["heal"]
-    ]
+    valid_heal_names = _ABILITY_NAMES[(healer.player_class, healer.spec, "heal")]
     assert ev.ability_name in valid_heal_names, (
         f"Healer {healer.player_class}/{healer.spec} lanzó '{ev.ability_name}' que no es heal"
     )
@@ -133,12 +128,9 @@ def test_generate_events_unique_ids(events):
     )
 
 
-def test_damage_events_no_pure_healer_as_source(session, events):
+def test_damage_events_no_pure_healer_as_source(player_map, events):
     damage_events = [e for e in events if e.event_type.value == "combat_damage"]
 
-    # Construir lookup rápido player_id → player
-    player_map = {p.player_id: p for p in session.players}
-
     for ev in damage_events:
         # boss_phase events tienen como source el boss_id, no un player_id
         if ev.source_player_id not in player_map:
@@ -155,6 +147,68 @@ def test_damage_events_no_pure_healer_as_source(session, events):
             )
 
 
+def test_generate_event_columns_match_schema(generator, session):
+    columns = generator.generate_event_columns(session, num_events=200)
+
+    assert list(columns) == list(WoWRaidEvent.model_fields)
+    lengths = {len(values) for values in columns.values()}
+    assert len(lengths) == 1 and lengths.pop() >= 200
+
+    # Cada fila reconstruida desde las columnas es un evento válido
+    n = len(columns["event_id"])
+    rows = [{name: values[i] for name, values in columns.items()} for i in range(n)]
+    for row in rows[:50]:
+        WoWRaidEvent.model_validate(row)
+
+
+def test_write_events_parquet_roundtrip(generator, session, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "events.parquet"
+    n_rows = generator.write_events_parquet(
+        session, num_events=300, path=str(path), chunk_size=100
+    )
+
+    table = pq.read_table(path)
+    assert table.num_rows == n_rows >= 300
+    assert table.column_names == list(WoWRaidEvent.model_fields)
+
+    # Las filas leídas de Parquet siguen cumpliendo el schema
+    for row in table.slice(0, 20).to_pylist():
+        WoWRaidEvent.model_validate(row)
+
+
+def test_write_events_parquet_one_row_group_per_chunk(generator, session, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "events.parquet"
+    n_rows = generator.write_events_parquet(
+        session, num_events=350, path=str(path), chunk_size=100
+    )
+
+    # Cada trozo se vuelca por separado: un row group de <= chunk_size filas
+    parquet = pq.ParquetFile(path)
+    sizes = [
+        parquet.metadata.row_group(i).num_rows for i in range(parquet.num_row_groups)
+    ]
+    assert parquet.num_row_groups > 1
+    assert sum(sizes) == n_rows >= 350
+    assert max(sizes) <= 100
+
+
+def test_simple_path_model_construct_events_are_valid(session):
+    # Sin fases -> camino simple; strict=False -> model_construct (sin validar)
+    fast = WoWEventGenerator(seed=7, strict=False)
+    no_phases = replace(session, phases=[])
+    events = fast.generate_events(no_phases, num_events=300)
+
+    assert len(events) == 300
+    assert {e.event_type for e in events} <= {EventType.COMBAT_DAMAGE, EventType.HEAL}
+    # Lo construido sin validar debe pasar la validación completa del schema
+    for ev in events:
+        WoWRaidEvent.model_validate(ev.model_dump())
+
+
 def test_boss_tracker_phase_transitions():
     from src.generators.raid_event_generator import BossHPTracker
 
@@ -178,3 +232,19 @@ def test_boss_tracker_phase_transitions():
     changed = tracker.register_damage(1_000)
     assert changed is False
     assert tracker.current_phase_number == 3
+
+
+def test_alias_table_reproduces_spec_weights():
+    for spec_key, profile in SPEC_PROFILES.items():
+        weights = profile["event_weights"]
+        prob, alias, etypes = _build_alias_table(weights)
+        k = len(etypes)
+
+        # Masa efectiva de cada event_type: (prob[j] + aportes como alias) / k
+        mass = dict.fromkeys(etypes, 0.0)
+        for j in range(k):
+            mass[etypes[j]] += prob[j] / k
+            mass[etypes[alias[j]]] += (1.0 - prob[j]) / k
+
+        for etype, w in weights.items():
+            assert abs(mass[etype] - w) < 1e-9, f"{spec_key}: {etype}"
@@ -7,11 +7,15 @@ Verifica que:
 3. Validadores personalizados funcionen correctamente
 """
 
+import json
 import pytest
 from datetime import datetime, timezone, timedelta
-from pydantic import ValidationError
+from typing import Annotated, Any
+from pydantic import TypeAdapter, ValidationError
 
 from src.schemas.eventos_schema import (
+    BATCH_ADAPTER,
+    export_json_schema,
     WoWRaidEvent,
     EventType,
     PlayerRole,
@@ -66,6 +70,28 @@ def test_invalid_damage_event_without_damage():
     print("✅ Test passed: combat_damage without damage rejected")
 
 
+@pytest.mark.parametrize(
+    ("event_type", "missing_field"),
+    [
+        (EventType.HEAL, "healing_amount"),
+        (EventType.MANA_REGENERATION, "resource_type"),
+    ],
+)
+def test_required_field_by_event_type_rejected(event_type, missing_field):
+    """Test: heal sin healing_amount y mana_regeneration sin resource_type."""
+    with pytest.raises(ValidationError) as exc_info:
+        WoWRaidEvent(
+            event_type=event_type,
+            timestamp=datetime.now(timezone.utc),
+            raid_id="raid001",
+            source_player_id="player123",
+            source_player_name="Anduin",
+        )
+
+    errors = exc_info.value.errors()
+    assert any(missing_field in str(e) for e in errors)
+
+
 def test_timestamp_in_future_rejected():
     """Test: Timestamp en el futuro debe ser rechazado."""
     future_time = datetime.now(timezone.utc) + timedelta(hours=1)
@@ -85,6 +111,26 @@ def test_timestamp_in_future_rejected():
     print("✅ Test passed: Future timestamp rejected")
 
 
+def test_batch_context_now_used_for_future_check():
+    """Test: en lote, el "now" del contexto sustituye al reloj del sistema."""
+    batch_now = datetime.now(timezone.utc) - timedelta(hours=1)
+    event = {
+        "event_type": "heal",
+        "timestamp": (batch_now + timedelta(minutes=5)).isoformat(),
+        "raid_id": "raid001",
+        "source_player_id": "player123",
+        "source_player_name": "Anduin",
+        "healing_amount": 8500.0,
+    }
+
+    with pytest.raises(ValidationError) as exc_info:
+        BATCH_ADAPTER.validate_python([event], context={"now": batch_now})
+
+    errors = exc_info.value.errors()
+    assert errors[0]["loc"][0] == 0
+    assert any("future" in str(e).lower() for e in errors)
+
+
 def test_valid_heal_event():
     """Test: Evento de curación válido debe pasar."""
     event = WoWRaidEvent(
@@ -165,5 +211,32 @@ def test_extra_fields_rejected():
     print("✅ Test passed: Extra fields rejected")
 
 
+def test_defaults_are_valid():
+    """Test: todos los defaults cumplen las restricciones de su campo.
+
+    El modelo no usa validate_default, así que este test garantiza el
+    invariante que antes se comprobaba en cada evento.
+    """
+    for name, field in WoWRaidEvent.model_fields.items():
+        if field.is_required():
+            continue
+        default = field.get_default(call_default_factory=True)
+        adapter: TypeAdapter[Any] = TypeAdapter(Annotated[field.annotation, field])
+        assert adapter.validate_python(default) == default, name
+
+
+def test_packaged_json_schema_is_current(tmp_path):
+    """Test: el JSON Schema pregenerado coincide con el modelo actual.
+
+    Si falla, regenerarlo con write_packaged_json_schema().
+    """
+    out = tmp_path / "eventos_schema.json"
+    export_json_schema(str(out))
+
+    assert json.loads(out.read_text(encoding="utf-8")) == (
+        WoWRaidEvent.model_json_schema()
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,53 +1,36 @@
 import pandas as pd
 
-from src.analytics.aggregators import build_raid_summary, build_player_raid_stats
+from src.analytics.aggregators import (
+    build_gold,
+    build_player_raid_stats,
+    build_raid_summary,
+)
 
 
 def test_build_raid_summary_simple_success():
     # 1. DataFrame Silver mínimo con una sola raid
-    data = [
-        # Evento de daño al boss (kill)
+    # Eventos: daño al boss (kill), curación de un healer, muerte del healer
+    df_silver = pd.DataFrame(
         {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:00Z"),
-            "event_date": "2026-01-01",
-            "event_type": "combat_damage",
-            "damage_amount": 15000.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "boss",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "player1",
-            "source_player_role": "dps",
-        },
-        # Evento de curación de un healer
-        {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:01Z"),
-            "event_date": "2026-01-01",
-            "event_type": "heal",
-            "damage_amount": 0.0,
-            "healing_amount": 5000.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 100.0,
-            "source_player_id": "player2",
-            "source_player_role": "healer",
-        },
-        # Evento de muerte del healer
-        {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:02Z"),
-            "event_date": "2026-01-01",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "player2",
-            "source_player_role": "healer",
-        },
-    ]
-
-    df_silver = pd.DataFrame(data)
+            "raid_id": ["raid001"] * 3,
+            "timestamp": pd.to_datetime(
+                [
+                    "2026-01-01T10:00:00Z",
+                    "2026-01-01T10:00:01Z",
+                    "2026-01-01T10:00:02Z",
+                ],
+                utc=True,
+            ),
+            "event_date": ["2026-01-01"] * 3,
+            "event_type": ["combat_damage", "heal", "player_death"],
+            "damage_amount": [15000.0, 0.0, 0.0],
+            "healing_amount": [0.0, 5000.0, 0.0],
+            "target_entity_type": ["boss", "player", "player"],
+            "target_entity_health_pct_after": [0.0, 100.0, 0.0],
+            "source_player_id": ["player1", "player2", "player2"],
+            "source_player_role": ["dps", "healer", "healer"],
+        }
+    )
 
     # 2. Ejecutar la agregación Gold
     raid_summary = build_raid_summary(df_silver)
@@ -80,85 +63,35 @@ def test_build_raid_summary_simple_success():
 
 def test_build_raid_summary_wipe_case():
     # 1. DataFrame Silver mínimo para un caso de wipe
-    data = [
-        # Daño al boss, pero no lo matan (se queda al 50 %)
-        {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:00Z"),
-            "event_date": "2026-01-02",
-            "event_type": "combat_damage",
-            "damage_amount": 8000.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "boss",
-            "target_entity_health_pct_after": 50.0,
-            "source_player_id": "playerA",
-            "source_player_role": "dps",
-        },
-        # Algo de curación
-        {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:05Z"),
-            "event_date": "2026-01-02",
-            "event_type": "heal",
-            "damage_amount": 0.0,
-            "healing_amount": 3000.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 100.0,
-            "source_player_id": "playerB",
-            "source_player_role": "healer",
-        },
-        # Varias muertes (más que n_players = 2)
-        {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:10Z"),
-            "event_date": "2026-01-02",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "playerA",
-            "source_player_role": "dps",
-        },
-        {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:12Z"),
-            "event_date": "2026-01-02",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "playerB",
-            "source_player_role": "healer",
-        },
+    # Eventos: daño al boss sin matarlo (se queda al 50 %), algo de
+    # curación y varias muertes (más que n_players = 2).
+    # event_type / target_entity_type como category, igual que los lee Gold
+    df_silver = pd.DataFrame(
         {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:14Z"),
-            "event_date": "2026-01-02",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "playerA",
-            "source_player_role": "dps",
-        },
-        {
-            "raid_id": "raid002",
-            "timestamp": pd.Timestamp("2026-01-02T20:00:16Z"),
-            "event_date": "2026-01-02",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "playerB",
-            "source_player_role": "healer",
-        },
-    ]
-
-    df_silver = pd.DataFrame(data)
+            "raid_id": ["raid002"] * 6,
+            "timestamp": pd.to_datetime(
+                [
+                    "2026-01-02T20:00:00Z",
+                    "2026-01-02T20:00:05Z",
+                    "2026-01-02T20:00:10Z",
+                    "2026-01-02T20:00:12Z",
+                    "2026-01-02T20:00:14Z",
+                    "2026-01-02T20:00:16Z",
+                ],
+                utc=True,
+            ),
+            "event_date": ["2026-01-02"] * 6,
+            "event_type": pd.Categorical(
+                ["combat_damage", "heal"] + ["player_death"] * 4
+            ),
+            "damage_amount": [8000.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            "healing_amount": [0.0, 3000.0, 0.0, 0.0, 0.0, 0.0],
+            "target_entity_type": pd.Categorical(["boss"] + ["player"] * 5),
+            "target_entity_health_pct_after": [50.0, 100.0, 0.0, 0.0, 0.0, 0.0],
+            "source_player_id": ["playerA", "playerB"] * 3,
+            "source_player_role": ["dps", "healer"] * 3,
+        }
+    )
 
     # 2. Ejecutar la agregación Gold
     raid_summary = build_raid_summary(df_silver)
@@ -189,58 +122,31 @@ def test_build_raid_summary_wipe_case():
 
 def test_build_player_raid_stats_simple():
     # Mismo Silver que en el test success anterior
-    data = [
-        {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:00Z"),
-            "event_date": "2026-01-01",
-            "event_type": "combat_damage",
-            "damage_amount": 15000.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "boss",
-            "target_entity_id": "player1",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "player1",
-            "source_player_name": "Alice",
-            "source_player_class": "mage",
-            "source_player_role": "dps",
-            "is_critical_hit": True,
-        },
+    df_silver = pd.DataFrame(
         {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:01Z"),
-            "event_date": "2026-01-01",
-            "event_type": "heal",
-            "damage_amount": 0.0,
-            "healing_amount": 5000.0,
-            "target_entity_type": "player",
-            "target_entity_id": "player2",
-            "target_entity_health_pct_after": 100.0,
-            "source_player_id": "player2",
-            "source_player_name": "Bob",
-            "source_player_class": "priest",
-            "source_player_role": "healer",
-            "is_critical_hit": False,
-        },
-        {
-            "raid_id": "raid001",
-            "timestamp": pd.Timestamp("2026-01-01T10:00:02Z"),
-            "event_date": "2026-01-01",
-            "event_type": "player_death",
-            "damage_amount": 0.0,
-            "healing_amount": 0.0,
-            "target_entity_type": "player",
-            "target_entity_id": "player1",
-            "target_entity_health_pct_after": 0.0,
-            "source_player_id": "player2",
-            "source_player_name": "Bob",
-            "source_player_class": "priest",
-            "source_player_role": "healer",
-            "is_critical_hit": False,
-        },
-    ]
-
-    df_silver = pd.DataFrame(data)
+            "raid_id": ["raid001"] * 3,
+            "timestamp": pd.to_datetime(
+                [
+                    "2026-01-01T10:00:00Z",
+                    "2026-01-01T10:00:01Z",
+                    "2026-01-01T10:00:02Z",
+                ],
+                utc=True,
+            ),
+            "event_date": ["2026-01-01"] * 3,
+            "event_type": ["combat_damage", "heal", "player_death"],
+            "damage_amount": [15000.0, 0.0, 0.0],
+            "healing_amount": [0.0, 5000.0, 0.0],
+            "target_entity_type": ["boss", "player", "player"],
+            "target_entity_id": ["player1", "player2", "player1"],
+            "target_entity_health_pct_after": [0.0, 100.0, 0.0],
+            "source_player_id": ["player1", "player2", "player2"],
+            "source_player_name": ["Alice", "Bob", "Bob"],
+            "source_player_class": ["mage", "priest", "priest"],
+            "source_player_role": ["dps", "healer", "healer"],
+            "is_critical_hit": [True, False, False],
+        }
+    )
 
     # Primero construir raid_summary
     raid_summary = build_raid_summary(df_silver)
@@ -279,3 +185,8 @@ def test_build_player_raid_stats_simple():
     assert bob["crit_events"] == 0
     assert bob["crit_rate"] == 0.0
     assert bob["healing_share"] == 1.0  # es el único que cura
+
+    # build_gold comparte la factorización y da las mismas dos tablas
+    gold_summary, gold_stats = build_gold(df_silver)
+    pd.testing.assert_frame_equal(gold_summary, raid_summary)
+    pd.testing.assert_frame_equal(gold_stats, player_stats)
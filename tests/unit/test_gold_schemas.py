@@ -0,0 +1,70 @@
+from datetime import date
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from src.schemas.gold_schemas import DimRaidSchema, PlayerImpactIndexSchema
+
+
+def _dim_raid(**overrides: Any) -> DimRaidSchema:
+    data: dict[str, Any] = {
+        "raid_id": "raid001",
+        "event_date": date(2026, 1, 1),
+        "raid_size": 20,
+    }
+    return DimRaidSchema.model_validate({**data, **overrides})
+
+
+def test_dim_raid_difficulty_none_defaults_to_normal():
+    # Sin dato de dificultad (None) se guarda "Normal", igual que si se omite
+    assert _dim_raid(difficulty=None).difficulty == "Normal"
+    assert _dim_raid().difficulty == "Normal"
+    assert _dim_raid(difficulty="Mythic").difficulty == "Mythic"
+
+
+def test_dim_raid_difficulty_rejects_unknown_value():
+    with pytest.raises(ValidationError):
+        _dim_raid(difficulty="LFR")
+
+
+def _impact(**overrides: Any) -> PlayerImpactIndexSchema:
+    data: dict[str, Any] = {
+        "raid_id": "raid001",
+        "event_date": date(2026, 1, 1),
+        "player_id": "player1",
+        "player_name": "Alice",
+        "damage_share": 0.5,
+        "healing_share": 0.1,
+        "crit_rate": 0.2,
+        "player_deaths": 1,
+        "impact_rank": 1,
+    }
+    return PlayerImpactIndexSchema.model_validate({**data, **overrides})
+
+
+def test_impact_score_formula():
+    # 0.35*50 + 0.35*10 + 0.15*20 - 0.10*10 = 17.5 + 3.5 + 3.0 - 1.0
+    assert _impact().impact_score == pytest.approx(23.0)
+
+
+def test_impact_score_clamped_to_zero():
+    # Sin aportación y con muertes la fórmula da negativo (-5.0) -> 0
+    player = _impact(
+        damage_share=0.0, healing_share=0.0, crit_rate=0.0, player_deaths=5
+    )
+    assert player.impact_score == 0.0
+
+
+def test_impact_score_clamped_to_hundred():
+    # Con features en rango el máximo es 85; shares fuera de rango (sin
+    # validar, model_construct) ejercitan el tope superior
+    player = PlayerImpactIndexSchema.model_construct(
+        damage_share=2.0, healing_share=2.0, crit_rate=1.0, player_deaths=0
+    )
+    assert player.impact_score == 100.0
+
+
+def test_impact_score_in_model_dump():
+    dumped = _impact().model_dump()
+    assert dumped["impact_score"] == pytest.approx(23.0)
@@ -0,0 +1,35 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.storage import minio_client
+
+
+def _sample_batch() -> dict:
+    return {
+        "batch_id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "received_at": datetime(2026, 1, 1, 10, 0, 0, 123456),  # naive -> UTC
+        "sent_at": datetime(2026, 1, 1, 10, 0, 1, tzinfo=timezone.utc),
+        "events": [{"damage_amount": np.float64(1500.5), "count": np.int64(3)}],
+    }
+
+
+def test_dumps_bytes_stdlib_fallback(monkeypatch):
+    # Sin orjson: json de la stdlib con _json_default
+    monkeypatch.setattr(minio_client, "_HAS_ORJSON", False)
+    decoded = json.loads(minio_client._dumps_bytes(_sample_batch()))
+
+    assert decoded["batch_id"] == "12345678-1234-5678-1234-567812345678"
+    assert decoded["received_at"] == "2026-01-01T10:00:00.123456+00:00"
+    assert decoded["sent_at"] == "2026-01-01T10:00:01+00:00"
+    assert decoded["events"] == [{"damage_amount": 1500.5, "count": 3}]
+
+
+def test_dumps_bytes_fallback_matches_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    fast = json.loads(minio_client._dumps_bytes(_sample_batch()))
+    monkeypatch.setattr(minio_client, "_HAS_ORJSON", False)
+    assert json.loads(minio_client._dumps_bytes(_sample_batch())) == fast